@@ -0,0 +1,110 @@
+"""
+Generate synthetic ARM64 assembly files for benchmarking the linter.
+
+Files look like course submissions: a preamble, .data and .text sections and
+functions closed by END comments, with style violations injected at a
+configurable rate.
+"""
+import os
+import random
+
+MNEMONICS = ('MOV', 'ADD', 'SUB', 'MUL', 'LDR', 'STR', 'CMP', 'BL', 'B.EQ')
+REGISTERS = (
+    tuple(f'x{i}' for i in range(16)) + tuple(f'w{i}' for i in range(8))
+)
+
+
+def _instruction(rng: random.Random, violations: float) -> str:
+    mnemonic = rng.choice(MNEMONICS)
+    registers = [rng.choice(REGISTERS) for _ in range(rng.randint(1, 3))]
+    indent = '    '
+
+    if rng.random() < violations:
+        kind = rng.randrange(3)
+        if kind == 0:
+            indent = '\t'
+        elif kind == 1:
+            mnemonic = mnemonic.lower()
+        else:
+            registers[0] = 'R' + registers[0][1:]
+
+    if mnemonic.upper() in ('BL', 'B.EQ'):
+        return f'{indent}{mnemonic} label{rng.randrange(100)}\n'
+    if rng.random() < 0.2:
+        registers[-1] = f'#{rng.randrange(256)}'
+    return f'{indent}{mnemonic} {", ".join(registers)}\n'
+
+
+def generate_source(
+    name: str,
+    lines: int = 200,
+    functions: int = 4,
+    violations: float = 0.05,
+    seed: int = 0,
+) -> str:
+    """
+    Return the source of a file of roughly `lines` lines.
+
+    `violations` is the fraction of lines that break a rule.
+    """
+    rng = random.Random(seed)
+    function_names = [f'function{i}' for i in range(functions)]
+
+    out = [
+        f'# Program Name: {name}\n',
+        '# Author: Jane Doe\n',
+        '# Date: 01/01/2024\n',
+        '# Purpose: Synthetic benchmark input.\n',
+        f'# Functions: {" ".join(function_names)}\n',
+        '\n',
+    ]
+
+    body = max(1, (lines - len(out)) // max(1, functions) - 6)
+    for function_name in function_names:
+        out.append('.text\n')
+        out.append(f'{function_name}:\n')
+        for _ in range(body):
+            if rng.random() < 0.1:
+                out.append('  \n' if rng.random() < violations else '\n')
+            elif rng.random() < 0.1:
+                out.append(f'    # Step {rng.randrange(1000)}\n')
+            else:
+                out.append(_instruction(rng, violations))
+
+        # Occasionally forget the END comment.
+        if rng.random() >= violations:
+            out.append(f'# END {function_name}\n')
+
+        out.append('.data\n')
+        out.append(f'    msg{function_name}: .asciz "Hello"\n')
+        out.append('\n')
+
+    return ''.join(out)
+
+
+def write_corpus(
+    directory: str,
+    files: int = 100,
+    lines: int = 200,
+    violations: float = 0.05,
+    seed: int = 0,
+) -> list[str]:
+    """
+    Write `files` generated files to directory and return their paths.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    paths = []
+    for i in range(files):
+        name = f'benchmark{i}.s'
+        path = os.path.join(directory, name)
+        with open(path, 'w') as fp:
+            fp.write(generate_source(
+                name,
+                lines=lines,
+                violations=violations,
+                seed=seed + i,
+            ))
+        paths.append(path)
+
+    return paths
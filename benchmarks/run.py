@@ -0,0 +1,240 @@
+"""
+Measure linter throughput on a synthetic corpus.
+
+Each benchmark runs in a fresh process so its peak RSS is its own. Results
+can be saved as a baseline and later runs compared against it:
+
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+from benchmarks.corpus import write_corpus  # noqa: E402
+from jhu_assembly_linter import cmd, rules  # noqa: E402
+from jhu_assembly_linter.linter import Linter  # noqa: E402
+
+
+def _peak_rss(who: str = 'RUSAGE_SELF') -> int:
+    """
+    Return the peak resident set size of this process in bytes, or with
+    RUSAGE_CHILDREN, the largest of its finished child processes'.
+    """
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak = resource.getrusage(getattr(resource, who)).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _lint(paths, rule_ids=None):
+    selected = rules.select_rules(rule_ids)
+    for path in paths:
+        Linter(path, rules=selected).lint()
+
+
+_CLASSIFIER = Linter('')
+
+
+def classify_uncompiled(line: str):
+    """
+    Tell END markers and instruction lines apart as the linter did before
+    its patterns were precompiled, as the baseline for `classify`.
+    """
+    if re.match(r'^\s*#', line):
+        return re.match(r'^#\s+END\s+([_a-zA-Z0-9]+)\s*$', line)
+    if not line.strip():
+        return False
+    if line.strip().startswith('.'):
+        return False
+    return ':' not in line
+
+
+def classify(line: str):
+    """
+    Tell END markers and instruction lines apart with the linter's own
+    precompiled checks.
+    """
+    if _CLASSIFIER._check_is_comment_line(line):
+        return _CLASSIFIER._get_function_end_name(line)
+    return _CLASSIFIER._check_is_instruction_line(line)
+
+
+def _classify(paths, function):
+    for path in paths:
+        with open(path) as fp:
+            for line in fp:
+                function(line)
+
+
+def _multi(paths, jobs):
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            cmd.multi(['--jobs', str(jobs)] + paths)
+
+
+def _measure(name: str, paths: list[str], repeat: int, jobs: int) -> dict:
+    if name == 'lint':
+        def run():
+            _lint(paths)
+    elif name == 'multi':
+        def run():
+            _multi(paths, jobs)
+    elif name.startswith('classify'):
+        function = classify_uncompiled if name == 'classify-uncompiled' \
+            else classify
+
+        def run():
+            _classify(paths, function)
+    else:
+        rule_id = name.split(':', 1)[1]
+
+        def run():
+            _lint(paths, [rule_id])
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        'seconds': min(timings),
+        'peak_rss': _peak_rss(),
+        # multi lints in worker processes, whose memory is not counted in
+        # its own peak.
+        'worker_peak_rss': _peak_rss('RUSAGE_CHILDREN'),
+    }
+
+
+def benchmark_names() -> list[str]:
+    return ['lint', 'multi', 'classify', 'classify-uncompiled'] + [
+        f'rule:{rule.id}' for rule in rules.RULES
+    ]
+
+
+def run_benchmarks(paths, repeat=3, jobs=None, names=None) -> dict:
+    lines = 0
+    for path in paths:
+        with open(path) as fp:
+            lines += sum(1 for _ in fp)
+
+    jobs = jobs or os.cpu_count() or 1
+    context = multiprocessing.get_context('spawn')
+
+    results = {}
+    for name in names or benchmark_names():
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            result = executor.submit(
+                _measure, name, paths, repeat, jobs,
+            ).result()
+
+        seconds = result['seconds']
+        results[name] = {
+            'seconds': seconds,
+            'lines_per_sec': lines / seconds,
+            'files_per_sec': len(paths) / seconds,
+            'peak_rss': result['peak_rss'],
+            'worker_peak_rss': result['worker_peak_rss'],
+        }
+
+    return results
+
+
+def format_results(results: dict, baseline: dict = None) -> str:
+    header = (
+        f'{"benchmark":<24} {"lines/s":>12} {"files/s":>10} {"RSS MB":>8} '
+        f'{"wkr MB":>8}'
+    )
+    if baseline:
+        header += f' {"vs base":>8}'
+
+    rows = [header, '-' * len(header)]
+    for name, result in results.items():
+        row = (
+            f'{name:<24} {result["lines_per_sec"]:>12,.0f} '
+            f'{result["files_per_sec"]:>10,.1f} '
+            f'{result["peak_rss"] / 2 ** 20:>8.1f} '
+        )
+        worker_peak = result.get('worker_peak_rss')
+        row += f'{worker_peak / 2 ** 20:>8.1f}' if worker_peak else f'{"-":>8}'
+        if baseline and name in baseline:
+            change = result['lines_per_sec'] / baseline[name]['lines_per_sec']
+            row += f' {change - 1:>+8.1%}'
+        rows.append(row)
+
+    return '\n'.join(rows)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser('Benchmark the JHU assembly linter')
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--lines', type=int, default=500)
+    parser.add_argument('--violations', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        help='Workers for the multi benchmark (default: number of CPUs)',
+    )
+    parser.add_argument(
+        '--only',
+        action='append',
+        choices=benchmark_names(),
+        help='Benchmark to run (may be repeated; default: all)',
+    )
+    parser.add_argument('--save', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON file to compare to')
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)['results']
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_corpus(
+            directory,
+            files=args.files,
+            lines=args.lines,
+            violations=args.violations,
+            seed=args.seed,
+        )
+        results = run_benchmarks(
+            paths, repeat=args.repeat, jobs=args.jobs, names=args.only,
+        )
+
+    print(format_results(results, baseline))
+
+    if args.save:
+        with open(args.save, 'w') as fp:
+            json.dump({
+                'corpus': {
+                    'files': args.files,
+                    'lines': args.lines,
+                    'violations': args.violations,
+                    'seed': args.seed,
+                },
+                'results': results,
+            }, fp, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
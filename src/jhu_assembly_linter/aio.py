@@ -0,0 +1,87 @@
+import asyncio
+import os
+from functools import partial
+
+from .runner import lint_file
+
+DEFAULT_LIMIT = 8
+
+
+async def lint_paths(
+    paths,
+    rules=None,
+    executor=None,
+    limit: int = DEFAULT_LIMIT,
+):
+    """
+    Lint paths without blocking the event loop, yielding (path, findings)
+    pairs as each file finishes.
+
+    Files are read and linted on executor. By default, a pool of up to
+    limit worker processes is created for this call and shut down with it,
+    so linting neither competes with the event loop for the GIL nor takes
+    up the loop's default executor. A ThreadPoolExecutor saves starting
+    the processes, but only keeps the loop from blocking.
+
+    At most limit files are read, linted or waiting to be consumed at once,
+    and paths is only advanced as slots free up, so a large batch can't
+    crowd out other work on the loop or executor.
+    """
+    loop = asyncio.get_running_loop()
+    owned = None
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = owned = ProcessPoolExecutor(
+            min(limit, os.cpu_count() or 1),
+        )
+    slots = asyncio.Semaphore(limit)
+    results = asyncio.Queue()
+    done = object()
+
+    async def lint_one(path):
+        try:
+            findings = await loop.run_in_executor(
+                executor, partial(lint_file, path, rules=rules),
+            )
+        except Exception as e:
+            await results.put(e)
+        else:
+            await results.put((path, findings))
+
+    async def produce():
+        tasks = set()
+        try:
+            for path in paths:
+                await slots.acquire()
+                task = loop.create_task(lint_one(path))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.wait(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await results.put(done)
+
+    producer = loop.create_task(produce())
+    try:
+        while True:
+            result = await results.get()
+            if result is done:
+                break
+            if isinstance(result, Exception):
+                raise result
+
+            yield result
+            # Only start another file once this one has been consumed.
+            slots.release()
+
+        # Re-raise anything raised while iterating paths.
+        await producer
+    finally:
+        producer.cancel()
+        if owned is not None:
+            # Don't block the loop; files still being linted are dropped.
+            owned.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,126 @@
+import os
+
+from .discovery import DEFAULT_INCLUDE, _matches
+
+ARCHIVE_SUFFIXES = (
+    '.zip',
+    '.tar',
+    '.tar.gz',
+    '.tgz',
+    '.tar.bz2',
+    '.tbz2',
+    '.tar.xz',
+    '.txz',
+)
+# Larger members are skipped rather than read into memory.
+MAX_MEMBER_SIZE = 32 * 1024 * 1024
+
+
+def is_archive(path: str) -> bool:
+    return path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _read(fp) -> bytes:
+    # Read a byte past the limit to tell a member that is too large.
+    content = fp.read(MAX_MEMBER_SIZE + 1)
+    return content if len(content) <= MAX_MEMBER_SIZE else None
+
+
+def _iter_zip(path: str, wanted):
+    import zipfile
+
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.is_dir() or not wanted(info.filename):
+                continue
+            if info.file_size > MAX_MEMBER_SIZE:
+                yield info.filename, None
+                continue
+
+            with archive.open(info) as fp:
+                yield info.filename, _read(fp)
+
+
+def _iter_tar(path: str, wanted):
+    import tarfile
+
+    # Members are read in stream order, so compressed archives are only
+    # decompressed once.
+    with tarfile.open(path) as archive:
+        for member in archive:
+            if not member.isfile() or not wanted(member.name):
+                continue
+            if member.size > MAX_MEMBER_SIZE:
+                yield member.name, None
+                continue
+
+            yield member.name, _read(archive.extractfile(member))
+
+
+def _error(on_error, message: str) -> None:
+    if on_error is None:
+        raise ValueError(message)
+    on_error(message)
+
+
+def iter_members(
+    path: str,
+    include=DEFAULT_INCLUDE,
+    exclude=(),
+    on_error=None,
+):
+    """
+    Yield (display name, file name, content) for files in an archive.
+
+    Only members matching include and not exclude are read, straight from
+    the archive without extracting it. The display name is
+    "archive:member" and the file name the member's base name, which is
+    what the file name rules check.
+
+    Members over `MAX_MEMBER_SIZE` bytes are skipped, and the rest of the
+    archive is if it can't be read, such as when it is corrupt. Either way
+    on_error is called with a message, or ValueError raised without it.
+    """
+    def wanted(name):
+        return _matches(name, include) and not _matches(name, exclude)
+
+    read = _iter_zip if path.lower().endswith('.zip') else _iter_tar
+    members = read(path, wanted)
+    try:
+        while True:
+            try:
+                name, content = next(members)
+            except StopIteration:
+                return
+            except Exception as e:
+                # The zip, tar and decompression modules each raise their
+                # own errors for corrupt or unsupported archives.
+                _error(on_error, f'{path}: {type(e).__name__}: {e}')
+                return
+
+            if content is None:
+                _error(
+                    on_error,
+                    f'{path}:{name}: Skipped, larger than {MAX_MEMBER_SIZE} '
+                    'bytes',
+                )
+            else:
+                yield f'{path}:{name}', os.path.basename(name), content
+    finally:
+        members.close()
+
+
+def expand_archives(
+    paths,
+    include=DEFAULT_INCLUDE,
+    exclude=(),
+    on_error=None,
+):
+    """
+    Yield paths, replacing archives with the members `iter_members` yields.
+    """
+    for path in paths:
+        if is_archive(path):
+            yield from iter_members(path, include, exclude, on_error)
+        else:
+            yield path
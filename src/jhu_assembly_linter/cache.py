@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import random
+import tempfile
+import time
+
+from .finding import Finding
+from .version import get_version
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+# Bytes of a file hashed at a time by `Cache.file_key`.
+READ_SIZE = 1 << 20
+# Scan the cache directory about this many times per max_size bytes written.
+PRUNES_PER_MAX_SIZE = 10
+# Temporary files older than this, in seconds, were left by a crashed write.
+STALE_TMP_AGE = 60 * 60
+
+
+class Cache:
+    """
+    On-disk cache of lint results keyed by file content and name.
+
+    Entries are touched on every hit so that `prune` can evict the least
+    recently used ones once the directory grows past `max_size` bytes.
+    Rather than scanning the directory on every run, `set` prunes at random
+    with a chance in proportion to the size written, so runs that write
+    little rarely scan and the cache overshoots by about a tenth.
+    """
+    SUFFIX = '.json'
+    TMP_PREFIX = 'tmp'
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.version = get_version()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _digest(self, file_name: str, rule_ids):
+        # The file name is part of the key as some checks depend on it.
+        digest = hashlib.sha256()
+        digest.update(self.version.encode())
+        digest.update(b'\0')
+        digest.update(','.join(rule_ids).encode())
+        digest.update(b'\0')
+        digest.update(file_name.encode())
+        digest.update(b'\0')
+        return digest
+
+    def key(self, content: bytes, file_name: str, rule_ids=()) -> str:
+        digest = self._digest(file_name, rule_ids)
+        digest.update(content)
+        return digest.hexdigest()
+
+    def file_key(self, path: str, file_name: str, rule_ids=()) -> str:
+        """
+        Return the key of the file at path, as `key` would for its content,
+        reading it in blocks rather than all at once.
+        """
+        digest = self._digest(file_name, rule_ids)
+        with open(path, 'rb') as fp:
+            while block := fp.read(READ_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key: str):
+        """
+        Return the cached findings tuples for key or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path) as fp:
+                findings = list(map(Finding.tuple_from_json, json.load(fp)))
+            os.utime(path)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        return findings
+
+    def set(self, key: str, findings: list[tuple]) -> None:
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.directory, prefix=self.TMP_PREFIX,
+            )
+            with os.fdopen(fd, 'w') as fp:
+                json.dump(findings, fp)
+                size = fp.tell()
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            return
+
+        if random.random() * self.max_size < size * PRUNES_PER_MAX_SIZE:
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Evict least recently used entries until the cache fits max_size.
+
+        Temporary files left by crashed writes are removed too.
+        """
+        entries = []
+        total = 0
+        stale = time.time() - STALE_TMP_AGE
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                is_tmp = entry.name.startswith(self.TMP_PREFIX)
+                if not is_tmp and not entry.name.endswith(self.SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                if is_tmp and stat.st_mtime < stale:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                    continue
+
+                # Files still being written count towards the size too.
+                if not is_tmp:
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
@@ -0,0 +1,142 @@
+import json
+import os
+import socket
+import stat
+import sys
+
+from .finding import Finding
+
+
+def default_socket_path(create: bool = False) -> str:
+    """
+    Return the socket path in the user's runtime directory.
+
+    Without $XDG_RUNTIME_DIR, the socket is kept in a directory of the
+    temporary directory only its owner can access, created if create is
+    true. Raises PermissionError if that directory belongs to someone
+    else or is accessible by others.
+    """
+    name = f'jhu-assembly-linter-{os.getuid()}'
+    directory = os.environ.get('XDG_RUNTIME_DIR')
+    if not directory:
+        import tempfile
+
+        directory = os.path.join(tempfile.gettempdir(), name)
+        if create:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        try:
+            status = os.lstat(directory)
+        except FileNotFoundError:
+            pass
+        else:
+            if (
+                not stat.S_ISDIR(status.st_mode)
+                or status.st_uid != os.getuid()
+                or status.st_mode & 0o077
+            ):
+                raise PermissionError(
+                    f'{directory} must be a directory only you can access',
+                )
+
+    return os.path.join(directory, f'{name}.sock')
+
+
+class Client:
+    """
+    Client for a running `jhu-assembly-linter-server`.
+
+    Requests and responses are single lines of JSON, so one connection can
+    lint any number of files.
+    """
+
+    def __init__(self, socket_path: str = None) -> None:
+        self.socket_path = socket_path or default_socket_path()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(self.socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile('rb')
+
+    def _request(self, request: dict) -> list[tuple]:
+        self._socket.sendall(json.dumps(request).encode() + b'\n')
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError('Lint server closed the connection')
+
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+
+        return list(map(Finding.tuple_from_json, response['findings']))
+
+    def lint_path(self, path: str) -> list[tuple]:
+        return self._request({'path': os.path.abspath(path)})
+
+    def lint_source(self, source: str, file: str = 'stdin.s') -> list[tuple]:
+        return self._request({'file': file, 'source': source})
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        'Lint files with a running jhu-assembly-linter-server',
+    )
+    parser.add_argument(
+        'files',
+        nargs='*',
+        help='Filenames to lint, or "-" to read from stdin',
+    )
+    parser.add_argument(
+        '--stdin-filename',
+        default='stdin.s',
+        help='File name to check source read from stdin against',
+    )
+    parser.add_argument(
+        '--socket',
+        help='Path of the server socket',
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        client = Client(args.socket)
+    except OSError as e:
+        print(f'Unable to connect to lint server: {e}', file=sys.stderr)
+        return 2
+
+    return_code = 0
+    with client:
+        for filename in args.files:
+            try:
+                if filename == '-':
+                    filename = args.stdin_filename
+                    findings = client.lint_source(sys.stdin.read(), filename)
+                else:
+                    findings = client.lint_path(filename)
+            except (ConnectionError, RuntimeError) as e:
+                # Report the file and go on with the others.
+                print(f'{filename}: {e}', file=sys.stderr)
+                return_code = 2
+                continue
+
+            if findings:
+                print(f'--- {filename}')
+                for f in findings:
+                    print(Finding.from_tuple(f))
+
+                return_code = max(return_code, 1)
+
+    return return_code
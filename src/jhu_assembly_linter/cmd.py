@@ -1,22 +1,289 @@
-from .linter import Linter
+import os
+import sys
+from collections import deque
+from functools import partial
+from itertools import chain, islice
 
+from .runner import lint_file, lint_source
 
-def main():
+
+def _add_cache_arguments(parser):
+    # The cache module is only imported if a cache is used.
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory in which to cache results of unchanged files',
+    )
+    parser.add_argument(
+        '--cache-max-size',
+        type=int,
+        help='Maximum size of the cache directory in bytes '
+             '(default: 64 MiB)',
+    )
+
+
+def _cache_from_args(args):
+    if not args.cache_dir:
+        return None
+
+    from .cache import DEFAULT_MAX_SIZE, Cache
+
+    return Cache(
+        args.cache_dir, max_size=args.cache_max_size or DEFAULT_MAX_SIZE,
+    )
+
+
+def _rule_ids(value: str) -> list[str]:
+    return [rule_id.strip() for rule_id in value.split(',') if rule_id.strip()]
+
+
+def _add_rule_arguments(parser):
+    from .rules import REGISTRY
+
+    parser.add_argument(
+        '--select',
+        type=_rule_ids,
+        metavar='IDS',
+        help='Comma separated rule IDs to run (default: all). '
+             f'Rules: {", ".join(REGISTRY)}',
+    )
+    parser.add_argument(
+        '--ignore',
+        type=_rule_ids,
+        default=[],
+        metavar='IDS',
+        help='Comma separated rule IDs to skip',
+    )
+
+
+def _rules_from_args(parser, args):
+    from .rules import select_rules
+
+    try:
+        return select_rules(args.select, args.ignore)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def _add_output_arguments(parser):
+    from .output import WRITERS
+
+    parser.add_argument(
+        '--format',
+        choices=tuple(WRITERS),
+        default='text',
+        help='Output format (default: text)',
+    )
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        import argparse
+
+        raise argparse.ArgumentTypeError(f'must be at least 1: {value}')
+    return number
+
+
+def _add_limit_arguments(parser):
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first finding',
+    )
+    parser.add_argument(
+        '--max-findings',
+        type=_positive_int,
+        metavar='N',
+        help='Stop after N findings in total',
+    )
+
+
+def _max_findings_from_args(args) -> int:
+    if args.fail_fast:
+        return 1
+    return args.max_findings
+
+
+def _changed_from_args(parser, args, include, exclude) -> dict:
+    """
+    Return the changed lines of included files if --diff or --diff-base
+    was given.
+    """
+    if not args.diff and args.diff_base is None:
+        return None
+
+    from .discovery import _matches
+    from .git import changed_lines
+
+    try:
+        changed = changed_lines(
+            args.diff_base or 'HEAD', paths=args.files,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    return {
+        path: ranges
+        for path, ranges in changed.items()
+        if _matches(path, include) and not _matches(path, exclude)
+    }
+
+
+def _in_hunks(findings: list[tuple], ranges) -> list[tuple]:
+    """
+    Drop findings of per-line rules outside the changed line ranges.
+    """
+    from .git import in_ranges
+    from .rules import REGISTRY
+
+    return [
+        f for f in findings
+        if not REGISTRY[f[4]].per_line or in_ranges(f[1], ranges)
+    ]
+
+
+def _writer_from_args(args, headers=True):
+    from .output import get_writer
+
+    return get_writer(args.format, sys.stdout, headers=headers)
+
+
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser('A Linter for JHU course EN.605.204')
     parser.add_argument(
         'file',
-        help='File to lint',
+        help='File to lint, or "-" to read from stdin',
     )
+    parser.add_argument(
+        '--stdin-filename',
+        default='stdin.s',
+        help='File name to check source read from stdin against',
+    )
+    _add_rule_arguments(parser)
+    _add_limit_arguments(parser)
+    _add_cache_arguments(parser)
+    _add_output_arguments(parser)
+
+    args = parser.parse_args(argv)
+
+    rules = _rules_from_args(parser, args)
+    max_findings = _max_findings_from_args(args)
+    cache = _cache_from_args(args)
+    writer = _writer_from_args(args, headers=False)
+    if args.file == '-':
+        filename = args.stdin_filename
+        content = sys.stdin.buffer.read()
+        findings = lint_source(
+            filename,
+            content,
+            cache=cache,
+            rules=rules,
+            max_findings=max_findings,
+        )
+    else:
+        filename = args.file
+        findings = lint_file(
+            filename, cache=cache, rules=rules, max_findings=max_findings,
+        )
+    writer.write(filename, findings)
+    writer.close()
+
+
+def _lint_target(target, **kwargs):
+    """
+    Lint a file path or an archive member, given as (display name, file
+    name, content), as `lint_file` would.
+    """
+    if isinstance(target, str):
+        return lint_file(target, **kwargs)
+
+    display_name, file_name, content = target
+    return lint_source(display_name, content, file_name=file_name, **kwargs)
+
+
+def _lint_target_with_stats(target, **kwargs) -> tuple:
+    """
+    Lint a target, returning its findings and stats in picklable form.
+    """
+    from .stats import LintStats
+
+    stats = LintStats()
+    findings = _lint_target(target, stats=stats, **kwargs)
+    return findings, stats.as_dict()
+
+
+def _display_name(target) -> str:
+    return target if isinstance(target, str) else target[0]
+
 
-    args = parser.parse_args()
+def _lint_files(
+    filenames,
+    jobs: int,
+    cache=None,
+    rules=None,
+    stats=None,
+    max_findings=None,
+    count=False,
+):
+    """
+    Yield (filename, findings) pairs in the order the files were given.
 
-    linter = Linter(args.file)
-    linter.lint()
+    filenames may be a lazy iterable and may hold archive members, as
+    yielded by `archive.iter_members`, which are reported under their
+    display names. Only a bounded number of files are in flight at once
+    so discovery and linting overlap, and files not yet started are
+    dropped if the caller stops early. If stats is given, each file's
+    stats, wherever it was linted, are merged into it. max_findings caps
+    the findings of each file. With count, findings are counts by rule ID
+    as returned by `lint_file`.
+    """
+    lint_file = partial(
+        _lint_target if stats is None else _lint_target_with_stats,
+        cache=cache,
+        rules=rules,
+        max_findings=max_findings,
+        count=count,
+    )
+
+    def collect(result):
+        if stats is None:
+            return result
+
+        from .stats import LintStats
+
+        findings, file_stats = result
+        stats.merge(LintStats.from_dict(file_stats))
+        return findings
+
+    filenames = iter(filenames)
+    head = list(islice(filenames, 2))
+    filenames = chain(head, filenames)
+    if jobs <= 1 or len(head) <= 1:
+        for filename in filenames:
+            yield _display_name(filename), collect(lint_file(filename))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    window = jobs * 4
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        try:
+            for filename in filenames:
+                future = executor.submit(lint_file, filename)
+                pending.append((_display_name(filename), future))
+                if len(pending) >= window:
+                    filename, future = pending.popleft()
+                    yield filename, collect(future.result())
 
-    for f in linter.findings:
-        print(f)
+            while pending:
+                filename, future = pending.popleft()
+                yield filename, collect(future.result())
+        finally:
+            for _, future in pending:
+                future.cancel()
 
 
 def multi(argv=None) -> int:
@@ -26,20 +293,170 @@ def multi(argv=None) -> int:
     parser.add_argument(
         'files',
         nargs='*',
-        help='Filenames to lint',
+        help='Files, directories, glob patterns (e.g. "src/**/*.s") or '
+             'zip/tar archives to lint',
+    )
+    parser.add_argument(
+        '--include',
+        action='append',
+        metavar='PATTERN',
+        help='Pattern of files to lint when walking directories '
+             '(default: *.s; may be repeated)',
+    )
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='PATTERN',
+        help='Pattern of files or directories to skip (may be repeated)',
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=0,
+        help='Number of worker processes (default: number of CPUs)',
     )
+    parser.add_argument(
+        '--diff',
+        action='store_true',
+        help='Only lint files changed since --diff-base, staged or not, '
+             'and only report per-line findings on changed lines',
+    )
+    parser.add_argument(
+        '--diff-base',
+        metavar='REF',
+        help='The commit to diff against; implies --diff (default: HEAD)',
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print time, lines and findings per rule to stderr',
+    )
+    _add_rule_arguments(parser)
+    _add_limit_arguments(parser)
+    parser.add_argument(
+        '--max-findings-per-file',
+        type=_positive_int,
+        metavar='N',
+        help='Stop linting a file after N findings in it',
+    )
+    parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='Print only the number of findings per rule',
+    )
+    parser.add_argument(
+        '--top',
+        type=_positive_int,
+        metavar='N',
+        help='With --summary, also list the N files with most findings',
+    )
+    _add_cache_arguments(parser)
+    _add_output_arguments(parser)
     args = parser.parse_args(argv)
 
+    if args.summary and (args.fail_fast or args.max_findings is not None):
+        parser.error(
+            '--summary cannot be combined with --fail-fast or --max-findings',
+        )
+    if args.summary and args.format != 'text':
+        parser.error('--summary only prints a text table')
+    if args.top is not None and not args.summary:
+        parser.error('--top requires --summary')
+
+    rules = _rules_from_args(parser, args)
+    stats = None
+    if args.stats:
+        from .stats import LintStats
+
+        stats = LintStats()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    cache = _cache_from_args(args)
+    from .discovery import DEFAULT_INCLUDE, iter_files
+
+    include = args.include or DEFAULT_INCLUDE
+    changed = _changed_from_args(parser, args, include, args.exclude)
+    archive_errors = []
+    if changed is None:
+        from .archive import expand_archives
+
+        def on_archive_error(message):
+            print(message, file=sys.stderr)
+            archive_errors.append(message)
+
+        filenames = expand_archives(
+            iter_files(
+                args.files,
+                include=include,
+                exclude=args.exclude,
+                archives=True,
+            ),
+            include=include,
+            exclude=args.exclude,
+            on_error=on_archive_error,
+        )
+    else:
+        filenames = list(changed)
+
+    summary = writer = None
+    if args.summary:
+        from .summary import Summary, count_findings
+
+        summary = Summary()
+    else:
+        writer = _writer_from_args(args)
+
+    remaining = _max_findings_from_args(args)
+    per_file = args.max_findings_per_file
+    if changed is not None:
+        # Findings are capped after dropping those outside changed lines.
+        worker_cap = None
+    elif remaining is not None:
+        # No single file may need more than the run has left.
+        worker_cap = min(per_file or remaining, remaining)
+    else:
+        worker_cap = per_file
+
     return_code = 0
-    for filename in args.files:
-        linter = Linter(filename)
-        linter.lint()
+    results = _lint_files(
+        filenames,
+        jobs,
+        cache=cache,
+        rules=rules,
+        stats=stats,
+        max_findings=worker_cap,
+        # Findings outside changed lines must be seen to be dropped.
+        count=summary is not None and changed is None,
+    )
+    for filename, findings in results:
+        if changed is not None:
+            findings = _in_hunks(findings, changed[filename])[:per_file]
+        if summary is not None:
+            if changed is not None:
+                findings = count_findings(findings)
+            summary.add(filename, findings)
+            continue
 
-        if linter.findings:
-            print(f'--- {filename}')
-            for f in linter.findings:
-                print(f)
+        if remaining is not None:
+            findings = findings[:remaining]
+            remaining -= len(findings)
 
+        if findings:
+            writer.write(filename, findings)
             return_code = 1
 
-    return return_code
+        if remaining == 0:
+            results.close()
+            break
+
+    if summary is not None:
+        print(summary.format_table(top=args.top or 0))
+        return_code = 1 if summary.total else 0
+    else:
+        writer.close()
+    if stats is not None:
+        print(stats.format_table(), file=sys.stderr)
+
+    # Archives that could not be read count as failing.
+    return 1 if archive_errors else return_code
@@ -0,0 +1,74 @@
+import fnmatch
+import os
+
+DEFAULT_INCLUDE = ('*.s',)
+GLOB_CHARACTERS = frozenset('*?[')
+
+
+def _matches(path: str, patterns) -> bool:
+    name = os.path.basename(path)
+    return any(
+        fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in patterns
+    )
+
+
+def _included(path: str, include, archives: bool) -> bool:
+    if _matches(path, include):
+        return True
+    if not archives:
+        return False
+
+    from .archive import is_archive
+
+    return is_archive(path)
+
+
+def _walk(directory: str, include, exclude, archives: bool = False):
+    """
+    Lazily yield included files below directory in sorted order.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        if _matches(entry.path, exclude):
+            continue
+
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk(entry.path, include, exclude, archives)
+        elif entry.is_file() and _included(entry.path, include, archives):
+            yield entry.path
+
+
+def iter_files(paths, include=DEFAULT_INCLUDE, exclude=(), archives=False):
+    """
+    Yield files to lint from paths as they are found.
+
+    Each path may be a file, a directory (walked recursively for files
+    matching include) or a glob pattern, where "**" matches any number of
+    directories. Files named explicitly are always yielded unless they
+    match exclude. If archives is true, archives found in directories or
+    by globs are yielded too, for their members to be linted.
+    """
+    for path in paths:
+        if GLOB_CHARACTERS.isdisjoint(path):
+            matches = (path,)
+            explicit = True
+        else:
+            import glob
+
+            matches = glob.iglob(path, recursive=True)
+            explicit = False
+
+        for match in matches:
+            if _matches(match, exclude):
+                continue
+
+            if os.path.isdir(match):
+                yield from _walk(match, include, exclude, archives)
+            elif explicit or _included(match, include, archives):
+                yield match
@@ -1,16 +1,33 @@
-
 class Finding:
+    """
+    A single lint error.
+
+    The source line is referenced, not copied, and the caret display is only
+    rendered the first time the finding is printed.
+    """
+    __slots__ = (
+        'message',
+        'line_number',
+        'columns',
+        'source',
+        'rule',
+        '_rendered',
+    )
+
     def __init__(
         self,
         message: str,
         line_number: int = 0,
         columns: tuple = (),
         source: str = '',
+        rule: str = '',
     ) -> None:
         self.message = message
         self.line_number = line_number
         self.columns = columns
         self.source = source
+        self.rule = rule
+        self._rendered = None
 
         if not self.source:
             if self.line_number > 0:
@@ -19,6 +36,11 @@ class Finding:
                 raise ValueError('Columns set but no source given.')
 
     def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = self._render()
+        return self._rendered
+
+    def _render(self) -> str:
         lines = [f'E:: {self.message}']
         if self.line_number:
             line_prefix = f'{self.line_number}: '
@@ -36,4 +58,33 @@ class Finding:
 
         return '\n'.join(lines)
 
-    __repr__ = __str__
+    def __repr__(self) -> str:
+        return (
+            f'Finding({self.message!r}, line_number={self.line_number}, '
+            f'columns={self.columns!r})'
+        )
+
+    def as_tuple(self) -> tuple:
+        """
+        Return a compact, picklable form of this finding.
+        """
+        return (
+            self.message,
+            self.line_number,
+            self.columns,
+            self.source,
+            self.rule,
+        )
+
+    @staticmethod
+    def tuple_from_json(data: list) -> tuple:
+        """
+        Restore a tuple from `as_tuple` that was round-tripped through JSON.
+        """
+        message, line_number, columns, source, rule = data
+        return (message, line_number, tuple(columns), source, rule)
+
+    @classmethod
+    def from_tuple(cls, data: tuple) -> 'Finding':
+        message, line_number, columns, source, rule = data
+        return cls(message, line_number, tuple(columns), source, rule)
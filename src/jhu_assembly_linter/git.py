@@ -0,0 +1,106 @@
+import os
+import re
+import subprocess
+
+HUNK_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+def _git(*args: str, cwd: str = None) -> str:
+    try:
+        result = subprocess.run(
+            ('git',) + args,
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except OSError as e:
+        raise ValueError(f'Unable to run git: {e}') from e
+    except subprocess.CalledProcessError as e:
+        raise ValueError(
+            f'git {args[0]} failed: {e.stderr.strip()}',
+        ) from e
+
+    return result.stdout
+
+
+def _diff_path(path: str) -> str:
+    """
+    Return the file name of a "+++" header, without its "b/" prefix.
+    """
+    # Names with spaces are followed by a tab.
+    path = path.rstrip('\t')
+    if path.startswith('"'):
+        # Names with special characters are C-quoted, with octal escapes
+        # for the bytes of any non-ASCII characters.
+        path = path[1:-1].encode('ascii').decode('unicode_escape') \
+            .encode('latin-1').decode('utf-8')
+    return path[2:]
+
+
+def parse_diff(diff: str) -> dict[str, list[tuple]]:
+    """
+    Map each file in a unified diff to the line ranges added to it.
+
+    The diff must use the "a/" and "b/" prefixes. Ranges are (first,
+    last) line numbers, inclusive, in the new file. Files with only
+    deletions map to an empty list.
+    """
+    changed: dict[str, list[tuple]] = {}
+    ranges = None
+    in_header = False
+    for line in diff.split('\n'):
+        if line.startswith('diff --git '):
+            in_header = True
+            ranges = None
+        elif in_header and line.startswith('+++ '):
+            # Only in the header; an added line starting "++ " looks alike.
+            path = line[4:]
+            if path != '/dev/null':
+                ranges = changed.setdefault(_diff_path(path), [])
+        elif line.startswith('@@') and ranges is not None:
+            in_header = False
+            match = HUNK_PATTERN.match(line)
+            if not match:
+                continue
+
+            first = int(match.group(1))
+            count = int(match.group(2) or 1)
+            if count:
+                ranges.append((first, first + count - 1))
+
+    return changed
+
+
+def changed_lines(base: str = 'HEAD', paths=(), cwd: str = None) -> dict:
+    """
+    Return the lines of files changed since base, staged or not.
+
+    Keys are paths relative to cwd (default: the current directory) and
+    values the changed line ranges as returned by `parse_diff`. Deleted
+    files are left out. Only the local `git` binary is used.
+    """
+    cwd = cwd or os.getcwd()
+    root = _git('rev-parse', '--show-toplevel', cwd=cwd).strip()
+    diff = _git(
+        'diff',
+        '--unified=0',
+        '--no-color',
+        '--no-ext-diff',
+        '--src-prefix=a/',
+        '--dst-prefix=b/',
+        '--diff-filter=d',
+        base,
+        '--',
+        *paths,
+        cwd=cwd,
+    )
+
+    return {
+        os.path.relpath(os.path.join(root, path), cwd): ranges
+        for path, ranges in parse_diff(diff).items()
+    }
+
+
+def in_ranges(line_number: int, ranges) -> bool:
+    return any(first <= line_number <= last for first, last in ranges)
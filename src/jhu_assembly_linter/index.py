@@ -0,0 +1,89 @@
+from .line import DIRECTIVE, END, LABEL, Line
+from .rules import Rule
+
+# Directives that switch away from a .text section.
+OTHER_SECTIONS = ('.data', '.bss', '.rodata', '.section')
+
+
+class Label:
+    """
+    A label line and the .text section it is in.
+    """
+    __slots__ = ('name', 'record', 'section', 'is_function')
+
+    def __init__(
+        self,
+        name: str,
+        record: Line,
+        section: Line = None,
+        is_function: bool = False,
+    ) -> None:
+        self.name = name
+        self.record = record
+        self.section = section
+        self.is_function = is_function
+
+
+class Section:
+    """
+    A .text directive and the first line after it.
+    """
+    __slots__ = ('record', 'first')
+
+    def __init__(self, record: Line, first: Line = None) -> None:
+        self.record = record
+        self.first = first
+
+
+class LabelIndex(Rule):
+    """
+    Labels, END markers and .text sections of a file.
+
+    Built in the same pass as the rules that query it, which they do from
+    their `finish` methods. It reports nothing itself.
+    """
+    id = 'label-index'
+
+    def start(self, linter) -> None:
+        super().start(linter)
+        self.labels: list[Label] = []
+        self.ends: list[tuple] = []
+        self.sections: list[Section] = []
+        self._section: Section = None
+        self._awaiting_first = False
+
+    def feed(self, record: Line) -> None:
+        if record.kind == DIRECTIVE and record.stripped.startswith('.text'):
+            self._section = Section(record)
+            self.sections.append(self._section)
+            self._awaiting_first = True
+            return
+
+        if self._awaiting_first:
+            self._awaiting_first = False
+            self._section.first = record
+
+        if record.kind == DIRECTIVE:
+            if record.stripped.startswith(OTHER_SECTIONS) and \
+                    '.text' not in record.stripped:
+                # Labels from here on are not in the last .text section.
+                self._section = None
+        elif record.kind == LABEL:
+            self.labels.append(Label(
+                record.stripped.split(':', 1)[0],
+                record,
+                section=self._section and self._section.record,
+                is_function=bool(record.label),
+            ))
+        elif record.kind == END:
+            self.ends.append((record.end_name, record))
+
+    def first_label(self, name: str) -> Label:
+        for label in self.labels:
+            if label.name == name:
+                return label
+        return None
+
+    @property
+    def function_names(self) -> set[str]:
+        return {label.name for label in self.labels if label.is_function}
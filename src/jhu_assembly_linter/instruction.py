@@ -0,0 +1,55 @@
+import re
+
+# "-" separates the registers of a "{r4-r6}" range, but belongs to a
+# negative "#-16" immediate.
+_TOKEN = r'(?:#-)?[^\s,\[\]{}()!/@-]+'
+
+# Operand tokens are separated by whitespace, commas and brackets; comments
+# start with "//", "@" or "/*".
+TOKEN_PATTERN = re.compile(
+    r'(?P<comment>//.*|@.*|/\*.*?(?:\*/|$))|' + _TOKEN,
+)
+# The common "MNEMONIC a, b, c" form, up to four plain operands, matched
+# at once so that all spans come from a single match.
+SIMPLE_PATTERN = re.compile(
+    rf'({_TOKEN})(?:[ \t]+({_TOKEN})'
+    + rf'(?:[ \t]*,[ \t]*({_TOKEN})' * 3
+    + ')?' * 3
+    + r')?\s*$',
+)
+REGISTER_PATTERN = re.compile(
+    r'[rxw]\d{1,16}|w?sp|[xw]zr|lr|fp|pc', re.IGNORECASE,
+)
+
+
+def parse_instruction(text: str, start: int = 0) -> tuple:
+    """
+    Parse the instruction in text, from offset start, in a single pass.
+
+    Returns (mnemonic, operands, comment): the span of the mnemonic, a tuple
+    of spans of the operand tokens and the span of the trailing comment, or
+    None. Spans are (start, end) offsets into text, so rules can report
+    them as columns. Tokens inside comments, including inline "/* */"
+    ones, are not operands.
+    """
+    match = SIMPLE_PATTERN.match(text, start)
+    if match is not None:
+        spans = match.regs
+        return spans[1], spans[2:match.lastindex + 1], None
+
+    spans = []
+    comment = None
+    for match in TOKEN_PATTERN.finditer(text, start):
+        if match.lastgroup == 'comment':
+            comment = match.span()
+        else:
+            comment = None
+            spans.append(match.span())
+
+    if not spans:
+        return None, (), comment
+    return spans[0], tuple(spans[1:]), comment
+
+
+def is_register(token: str) -> bool:
+    return REGISTER_PATTERN.fullmatch(token) is not None
@@ -0,0 +1,63 @@
+from .instruction import parse_instruction
+
+BLANK = 'blank'
+COMMENT = 'comment'
+END = 'end'
+DIRECTIVE = 'directive'
+LABEL = 'label'
+INSTRUCTION = 'instruction'
+
+COMMENT_KINDS = frozenset((COMMENT, END))
+
+
+class Line:
+    """
+    A source line, classified once and shared by every check.
+    """
+    __slots__ = (
+        'number',
+        'text',
+        'stripped',
+        'indent',
+        'kind',
+        'label',
+        'end_name',
+        '_instruction',
+    )
+
+    def __init__(
+        self,
+        number: int,
+        text: str,
+        stripped: str,
+        indent: int,
+        kind: str,
+        label: str = None,
+        end_name: str = None,
+    ) -> None:
+        self.number = number
+        self.text = text
+        self.stripped = stripped
+        self.indent = indent
+        self.kind = kind
+        self.label = label
+        self.end_name = end_name
+        self._instruction = None
+
+    @property
+    def is_comment(self) -> bool:
+        return self.kind in COMMENT_KINDS
+
+    @property
+    def instruction(self) -> tuple:
+        """
+        The (mnemonic, operands, comment) spans of an instruction line.
+
+        Parsed on first use and shared by every rule that checks it.
+        """
+        if self._instruction is None:
+            self._instruction = parse_instruction(self.text, self.indent)
+        return self._instruction
+
+    def __repr__(self) -> str:
+        return f'Line({self.number}, {self.kind}, {self.text!r})'
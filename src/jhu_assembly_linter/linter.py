@@ -1,281 +1,488 @@
+import io
 import os
 import re
-import string
+import time
+from itertools import chain
 
+from . import line as kinds
+from . import rules
 from .finding import Finding
+from .index import LabelIndex
+from .line import Line
+from .rules import RULES
 
 
 class Linter:
     FUNCTION_LINE_PATTERN = re.compile(r'^([_a-zA-Z0-9]+):\s*$')
+    FUNCTION_END_PATTERN = re.compile(r'^#\s+END\s+([_a-zA-Z0-9]+)\s*$')
 
     # Oh, type checking...
     SENTIAL_EMPTY_LINES = []
-
-    def __init__(self, file: str) -> None:
+    # Characters read at a time for rules that scan blocks of lines.
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(
+        self,
+        file: str,
+        rules=None,
+        stats=None,
+        max_findings: int = None,
+        counts: dict = None,
+    ) -> None:
         self._file_path = file
         self._file: str = os.path.basename(self._file_path)
+        self._rules = RULES if rules is None else tuple(rules)
+        self._stats = stats
+        self._max_findings = max_findings
+        # Findings rules may still report; None for no limit.
+        self._remaining: int = None
+        # If given, rules only count findings per rule ID in here.
+        self._counts = counts
         self._findings: list[Finding] = []
+        # None while the lines are held as one string in __text.
         self.__lines: list[str] = self.SENTIAL_EMPTY_LINES
+        # The lines joined, when given as one string by `from_source`.
+        self.__text: str = None
+        self.__records: list[Line] = []
+        self.__records_source: list[str] = None
+        self.__line_findings: list[list[Finding]] = None
+        self._index: LabelIndex = None
+        # Rule objects reused by every lint() if set, see `lint_many`.
+        self._checks: list = None
+
+    @classmethod
+    def from_source(cls, source, file: str = 'stdin.s', **kwargs) -> 'Linter':
+        """
+        Create a linter for source held in memory.
+
+        source may be a str, UTF-8 encoded bytes or an iterable of lines.
+        file is the logical file name used by the file name checks; nothing
+        is read from or written to the filesystem.
+        """
+        linter = cls(file, **kwargs)
+        linter._load(source)
+        return linter
+
+    def _load(self, source) -> None:
+        """
+        Replace the lines to lint, and any results, with those of source.
+        """
+        if isinstance(source, bytes):
+            source = source.decode('utf-8')
+
+        if isinstance(source, str):
+            # Translate universal newlines as open() would. Lines are only
+            # split out of the text if they are needed as a list.
+            if '\r' in source:
+                source = io.StringIO(source, newline=None).getvalue()
+            self.__lines = None
+            self.__text = source
+        else:
+            self.__lines = list(source)
+            self.__text = None
+        self.__records_source = None
+        self.__line_findings = None
+        self._findings = []
 
     @property
     def _lines(self):
         if self.__lines is self.SENTIAL_EMPTY_LINES:
             with open(self._file_path) as fp:
                 self.__lines = fp.readlines()
+        elif self.__lines is None:
+            # Don't keep the text alongside its lines.
+            self.__lines = io.StringIO(self.__text, newline='\n').readlines()
+            self.__text = None
         return self.__lines
 
-    def lint(self):
-        self._check_preamble()
-        self._check_file_name()
-        self._check_file_name_main()
-        self._check_data_section_follows_text_section()
-        self._check_end_follows_text_section()
-        self._check_instructions_uppercase()
-        self._check_registers_lowercase()
-        self._check_line_empty_with_nonzero_space()
-        self._check_spaces()
-
-    def _check_preamble(self):
+    @property
+    def _records(self) -> list[Line]:
         """
-        Ensure the preamble is present and well formatted.
+        Classified lines, built in a single pass and shared by all checks.
         """
-        preamble = []
-        for i, line in enumerate(self._lines, start=1):
-            if not self._check_is_comment_line(line):
-                break
-
-            preamble.append((i, line.strip().lstrip('#').lstrip()))
-
-        line_by_key: dict[str, tuple] = {}
-        for i, line in preamble:
-            key = line.split()
-            if not key:
-                continue
-
-            key = key[0].rstrip(':').strip().lower()
-            line_by_key[key] = (i, line)
+        lines = self._lines
+        if self.__records_source is not lines:
+            self.__records = [
+                self._classify_line(i, line)
+                for i, line in enumerate(lines, start=1)
+            ]
+            self.__records_source = lines
+        return self.__records
+
+    def _classify_line(self, number: int, line: str) -> Line:
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+
+        if stripped.startswith('#'):
+            # END markers must start in the first column.
+            end_name = None
+            if line.startswith('#'):
+                end_name = self._get_function_end_name(line)
+            kind = kinds.END if end_name else kinds.COMMENT
+            return Line(number, line, stripped, indent, kind,
+                        end_name=end_name)
+
+        if not stripped:
+            return Line(number, line, stripped, indent, kinds.BLANK)
+
+        if stripped.startswith('.'):
+            return Line(number, line, stripped, indent, kinds.DIRECTIVE)
 
-        program_line = line_by_key.get('program') or ()
-        if not program_line:
-            self._findings.append(Finding(
-                'Preamble error: No "Program Name" line found.',
-            ))
-        else:
-            self._check_preamble_program_line(*program_line)
+        if ':' in line:
+            return Line(number, line, stripped, indent, kinds.LABEL,
+                        label=self._get_fucntion_name(line))
 
-        author_line = line_by_key.get('author')
-        if not author_line:
-            self._findings.append(Finding(
-                'Preamble error: No "Author" line found.',
-            ))
-        else:
-            self._check_preamble_author_line(*author_line)
+        return Line(number, line, stripped, indent, kinds.INSTRUCTION)
 
-        date_line = line_by_key.get('date')
-        if not date_line:
-            self._findings.append(Finding(
-                'Preamble error: No "Date" line found.',
-            ))
+    def lint(self):
+        """
+        Lint the file in a single streaming pass over its lines.
+
+        Unless lines were already loaded, the file is read one line at a
+        time and each rule keeps only the state it needs, so memory use
+        does not grow with the size of the file. Only the selected rules
+        run, lines are only classified if a rule needs it and the file is
+        not read at all if no rule looks at its lines.
+
+        If the linter was given a `LintStats`, the time, lines and findings
+        of each rule are recorded into it. If it was given `max_findings`,
+        rules stop reporting and the file stops being read once that many
+        findings have been reported. If it was given a `counts` dict,
+        findings are only counted into it by rule ID and none are kept.
+        """
+        checks = self._checks
+        if checks is None:
+            checks = self._with_index([rule() for rule in self._rules])
+        self._remaining = self._max_findings
+
+        # Rules that can scan whole blocks of text do so when the text is
+        # read from the file or was given as one string, and are not fed.
+        streams = self.__lines is self.SENTIAL_EMPTY_LINES or \
+            self.__lines is None
+        scanners = []
+        if streams:
+            scanners = [check for check in checks if check.scans]
+        fed = [check for check in checks if not check.scans] \
+            if scanners else checks
+
+        scans = [check.scan for check in scanners]
+        if self._stats is not None:
+            scans = [self._timed_scan(check) for check in scanners]
+
+        records = ()
+        needs_lines = any(check.kinds is None or check.kinds for check in fed)
+        if needs_lines or scans:
+            classify = any(check.classify for check in fed)
+            records = self._iter_records(classify, scans, needs_lines)
+            if self._remaining is not None:
+                records = self._until_exhausted(records)
+
+        if self._stats is None:
+            self._run_rules(checks, records, fed)
         else:
-            self._check_preamble_date_line(*date_line)
+            self._stats.files += 1
+            self._run_rules_timed(checks, records, fed)
+
+    def _iter_records(
+        self,
+        classify: bool = True,
+        scans=(),
+        needs_lines: bool = True,
+    ):
+        """
+        Yield a record per line, handing blocks of lines to scans first.
 
-        purpose_line = line_by_key.get('purpose')
-        if not purpose_line:
-            self._findings.append(Finding(
-                'Preamble error: No "Purpose" line found.',
-            ))
-        else:
-            self._check_preamble_purpose_line(*purpose_line)
+        Each of scans is called with a block of whole lines and the number
+        of its first line. Lines are only split out of the blocks if
+        needs_lines is set.
+        """
+        make_record = self._classify_line if classify else self._raw_line
+
+        if self.__lines is not self.SENTIAL_EMPTY_LINES and \
+                self.__lines is not None:
+            if classify:
+                yield from self._records
+            else:
+                for i, line in enumerate(self.__lines, start=1):
+                    yield make_record(i, line)
+            return
+
+        if not scans and self.__lines is self.SENTIAL_EMPTY_LINES:
+            with open(self._file_path) as fp:
+                for i, line in enumerate(fp, start=1):
+                    yield make_record(i, line)
+            return
+
+        number = 1
+        for chunk in self._iter_chunks():
+            for scan in scans:
+                scan(chunk, number)
+
+            if needs_lines:
+                # Split on newlines only, as iterating over the file would.
+                lines = io.StringIO(chunk, newline='\n')
+                for i, line in enumerate(lines, start=number):
+                    yield make_record(i, line)
+
+            number += chunk.count('\n')
+            if self._remaining is not None and self._remaining <= 0:
+                return
+
+    def _iter_chunks(self):
+        """
+        Read the file, or slice the text held, in blocks of whole lines, at
+        most a line past `CHUNK_SIZE` characters each.
+        """
+        if self.__lines is None:
+            text = self.__text
+            start = 0
+            while start < len(text):
+                end = text.find('\n', start + self.CHUNK_SIZE - 1) + 1
+                yield text[start:end or len(text)]
+                start = end or len(text)
+            return
+
+        with open(self._file_path) as fp:
+            while True:
+                chunk = fp.read(self.CHUNK_SIZE)
+                if not chunk:
+                    return
+                if not chunk.endswith('\n'):
+                    chunk += fp.readline()
+                yield chunk
+
+    def _timed_scan(self, check):
+        rule_stats = self._stats.rule(check.id)
+        clock = time.perf_counter
+
+        def scan(text: str, number: int) -> None:
+            start = clock()
+            check.scan(text, number)
+            rule_stats.seconds += clock() - start
+            rule_stats.lines += text.count('\n')
+
+        return scan
+
+    def _until_exhausted(self, records):
+        for record in records:
+            if self._remaining <= 0:
+                return
+            yield record
+
+    def _raw_line(self, number: int, line: str) -> Line:
+        return Line(number, line, None, 0, None)
+
+    def _with_index(self, checks: list) -> list:
+        """
+        Put a fresh label index ahead of checks if any of them query it.
 
-        functions_line = line_by_key.get('functions')
-        if not functions_line:
-            self._findings.append(Finding(
-                'Preamble error: No "Functions" line found.',
-            ))
-        else:
-            self._check_preamble_functions_line(*functions_line)
+        Being fed first, the index is complete by the time rules finish.
+        """
+        if any(check.uses_index for check in checks):
+            self._index = LabelIndex()
+            return [self._index] + checks
+        return checks
 
-    def _check_file_name(self):
+    def _dispatch(self, checks, wrap) -> tuple:
         """
-        Check the file name follows the correct conventions.
+        Map checks to those fed every line and those fed by line kind.
         """
-        name = self._file[:-2]
+        for_all = [wrap(c) for c in checks if c.kinds is None]
+        by_kind: dict[str, list] = {}
+        for check in checks:
+            for kind in check.kinds or ():
+                by_kind.setdefault(kind, []).append(wrap(check))
+        return for_all, by_kind
+
+    def _run_rules(self, checks, records, fed=None):
+        """
+        Start checks, feed records to those in fed (default: all of them)
+        and finish them.
+        """
+        for check in checks:
+            check.start(self)
+
+        # Dispatch each line only to the rules interested in its kind.
+        feeds_for_all, feeds_by_kind = self._dispatch(
+            checks if fed is None else fed, lambda check: check.feed,
+        )
+
+        for record in records:
+            for feed in feeds_for_all:
+                feed(record)
+            for feed in feeds_by_kind.get(record.kind, ()):
+                feed(record)
+
+        for check in checks:
+            if self._remaining is None or self._remaining > 0:
+                check.finish()
+            self._findings.extend(check.findings)
+
+    def _run_rules_timed(self, checks, records, fed=None):
+        """
+        As `_run_rules`, recording per-rule stats as it goes.
+        """
+        clock = time.perf_counter
+        stats = self._stats
+
+        for check in checks:
+            start = clock()
+            check.start(self)
+            stats.rule(check.id).seconds += clock() - start
+
+        feeds_for_all, feeds_by_kind = self._dispatch(
+            checks if fed is None else fed,
+            lambda check: (check.feed, stats.rule(check.id)),
+        )
+
+        # Reading and classifying lines is timed on its own.
+        read_stats = stats.rule('read')
+        records = iter(records)
+        while True:
+            start = clock()
+            record = next(records, None)
+            read_stats.seconds += clock() - start
+            if record is None:
+                break
+            read_stats.lines += 1
+
+            for feed, rule_stats in chain(
+                feeds_for_all, feeds_by_kind.get(record.kind, ()),
+            ):
+                start = clock()
+                feed(record)
+                rule_stats.seconds += clock() - start
+                rule_stats.lines += 1
+
+        for check in checks:
+            rule_stats = stats.rule(check.id)
+            start = clock()
+            if self._remaining is None or self._remaining > 0:
+                check.finish()
+            rule_stats.seconds += clock() - start
+            if self._counts is None:
+                rule_stats.findings += len(check.findings)
+            else:
+                rule_stats.findings += self._counts.get(check.id, 0)
+            self._findings.extend(check.findings)
+
+    def _run_rule(self, rule):
+        self._run_rules(self._with_index([rule]), self._records)
+
+    def update(self, start: int, end: int, text: str) -> tuple:
+        """
+        Replace lines[start:end] with text and re-lint incrementally.
+
+        start and end are 0-based line indexes as in a slice, so an insert
+        has start == end, and text holds whole lines. Per-line rules only
+        re-check the new lines while the other rules re-run over the
+        already classified lines. Returns (added, removed), the findings
+        that appeared and those that went away; findings on lines moved by
+        the edit are reported as both. `max_findings` and `counts` do not
+        apply.
+        """
+        self._remaining = None
+        self._counts = None
+        records = self._records
+        line_checks = [rule() for rule in self._rules if rule.per_line]
+        for check in line_checks:
+            check.start(self)
+
+        line_findings = self.__line_findings
+        if line_findings is None:
+            line_findings = self.__line_findings = [
+                self._lint_line(line_checks, record) for record in records
+            ]
+
+        new_lines = io.StringIO(text, newline=None).readlines()
+        new_records = [
+            self._classify_line(i, line)
+            for i, line in enumerate(new_lines, start=start + 1)
+        ]
+        self._lines[start:end] = new_lines
+        records[start:end] = new_records
+        line_findings[start:end] = [
+            self._lint_line(line_checks, record) for record in new_records
+        ]
+
+        # Renumber the lines moved by the edit.
+        if len(new_lines) != end - start:
+            for i in range(start + len(new_lines), len(records)):
+                records[i].number = i + 1
+                if line_findings[i]:
+                    line_findings[i] = [
+                        Finding(f.message, i + 1, f.columns, f.source, f.rule)
+                        for f in line_findings[i]
+                    ]
+
+        old_findings = self._findings
+        self._findings = []
+        file_checks = [rule() for rule in self._rules if not rule.per_line]
+        self._run_rules(self._with_index(file_checks), records)
+
+        findings_by_rule: dict[str, list[Finding]] = {}
+        for f in self._findings:
+            findings_by_rule.setdefault(f.rule, []).append(f)
+        for findings in line_findings:
+            for f in findings:
+                findings_by_rule.setdefault(f.rule, []).append(f)
+
+        self._findings = [
+            f for rule in self._rules
+            for f in findings_by_rule.get(rule.id, ())
+        ]
+
+        def key(f):
+            return (f.rule, f.message, f.line_number, f.columns)
+
+        old_keys = set(map(key, old_findings))
+        new_keys = set(map(key, self._findings))
+        added = [f for f in self._findings if key(f) not in old_keys]
+        removed = [f for f in old_findings if key(f) not in new_keys]
+        return added, removed
+
+    def _lint_line(self, checks, record: Line) -> list[Finding]:
+        """
+        Run per-line rules over a single line and return their findings.
+        """
+        findings = []
+        for check in checks:
+            if check.kinds is None or record.kind in check.kinds:
+                check.feed(record)
+                if check.findings:
+                    findings.extend(check.findings)
+                    check.findings.clear()
+        return findings
 
-        invalidChars = set(name) - set(string.ascii_letters + string.digits)
-        if invalidChars:
-            self._findings.append(Finding(
-                f'File name contains invalid characters: {invalidChars}',
-            ))
+    def _check_preamble(self):
+        self._run_rule(rules.PreambleRule())
 
-        if name[0] not in string.ascii_lowercase:
-            self._findings.append(Finding(
-                'File starts with non-lowercase letter.',
-            ))
+    def _check_file_name(self):
+        self._run_rules([rules.FileNameRule()], ())
 
     def _check_file_name_main(self):
-        """
-        Check that if file has "main" function, it has "Main" in its name.
-        """
-        for i, line in enumerate(self._lines, start=1):
-            if self._check_is_comment_line(line):
-                continue
-
-            if self._check_is_instruction_line(line):
-                continue
-
-            if line.strip().startswith('main:'):
-                if not self._file.endswith('Main.s'):
-                    self._findings.append(Finding(
-                        'File name does not end with "Main" when it should.',
-                        line_number=i,
-                        source=line,
-                    ))
-                break
-        else:
-            if self._file.endswith('Main.s'):
-                self._findings.append(Finding(
-                    'File name ends with "Main" but no main function found.',
-                ))
+        self._run_rule(rules.FileNameMainRule())
 
     def _check_data_section_follows_text_section(self):
-        """
-        Check that all data sections follow text sections.
-        """
-        # TODO: Make this loop reset on new functions.
-        can_see_data = False
-        for i, line in enumerate(self._lines, start=1):
-            if line.strip().startswith('.text'):
-                can_see_data = True
-                continue
-
-            if line.strip().startswith('.data'):
-                if can_see_data:
-                    can_see_data = False
-                    continue
-                else:
-                    self._findings.append(Finding(
-                        'Data sections must follow a text section.',
-                        line_number=i,
-                        source=line,
-                    ))
+        self._run_rule(rules.DataSectionRule())
 
     def _check_end_follows_text_section(self):
-        """
-        Check that each function has an END comment.
-        """
-        function_names_found = set()
-        function_ends_found = set()
-
-        in_text = False
-        for i, line in enumerate(self._lines, start=1):
-            if line.strip().startswith('.text'):
-                in_text = True
-                continue
-
-            if in_text:
-                in_text = False
-
-                function_name = self._get_fucntion_name(line)
-                if not function_name:
-                    self._findings.append(Finding(
-                        'Expected function name after .text block start.',
-                        line_number=i,
-                        source=line,
-                    ))
-                    continue
-
-                # Main function is ignored.
-                if function_name == 'main':
-                    continue
-
-                function_names_found.add(function_name)
-
-            end = self._get_function_end_name(line)
-            if end:
-                function_ends_found.add(end)
-
-        s = function_names_found - function_ends_found - set(['main'])
-        if s:
-            self._findings.append(Finding(
-                f'Functions missing END comment: {s}',
-            ))
-
-        s = function_ends_found - function_names_found
-        if s:
-            self._findings.append(Finding(
-                f'END comments without associated function: {s}',
-            ))
+        self._run_rule(rules.FunctionEndRule())
 
     def _check_instructions_uppercase(self):
-        """
-        Check that instructions are uppercase.
-        """
-        for i, line in enumerate(self._lines, start=1):
-            if not self._check_is_instruction_line(line):
-                continue
-
-            if not line.strip().split()[0].isupper():
-                self._findings.append(Finding(
-                    'Instruction is not uppercase.',
-                    line_number=i,
-                    columns=(len(line) - len(line.lstrip()),),
-                    source=line,
-                ))
+        self._run_rule(rules.InstructionCaseRule())
 
     def _check_registers_lowercase(self):
-        """
-        Check registers are listed in lowercase.
-        """
-        for i, line in enumerate(self._lines, start=1):
-            if not self._check_is_instruction_line(line):
-                continue
-
-            chunk = line
-            m = True  # To get things started.
-            pos = 0
-            while m:
-                m = re.search(r'[ ,]R\d{1,16}([ ,])?', chunk)
-                if m:
-                    self._findings.append(Finding(
-                        'Register is not lowercase.',
-                        line_number=i,
-                        columns=(pos + m.start(),),
-                        source=line,
-                    ))
-                    pos += m.end() - 1
-                    chunk = line[pos:]
+        self._run_rule(rules.RegisterCaseRule())
 
     def _check_line_empty_with_nonzero_space(self):
-        """
-        Check check that empty lines have no trailing whitespace.
-        """
-        for i, line in enumerate(self._lines, start=1):
-            tmp_line = line.replace('\r', '').replace('\n', '')
-            if len(tmp_line) > 0 and len(line.strip()) == 0:
-                self._findings.append(Finding(
-                    'Non-functional whitespace found.',
-                    line_number=i,
-                    columns=(0, len(line)),
-                    source=line,
-                ))
+        self._run_rule(rules.EmptyLineWhitespaceRule())
 
     def _check_spaces(self):
-        """
-        Check each non-comment line to check that it does not have tabs.
-        """
-        for i, line in enumerate(self._lines, start=1):
-            try:
-                self._findings.append(Finding(
-                    'Tab found. Only spaces allowed.',
-                    line_number=i,
-                    columns=(line.index('\t'),),
-                    source=line,
-                ))
-            except ValueError:
-                pass
+        self._run_rule(rules.TabRule())
 
     def _check_is_comment_line(self, line: str):
-        return bool(re.match(r'^\s*#', line))
+        return line.lstrip().startswith('#')
 
     def _get_fucntion_name(self, line: str):
         m = self.FUNCTION_LINE_PATTERN.match(line)
@@ -288,7 +495,7 @@ class Linter:
         return bool(self.FUNCTION_LINE_PATTERN.match(line))
 
     def _get_function_end_name(self, line: str):
-        m = re.match(r'^#\s+END\s+([_a-zA-Z0-9]+)\s*$', line)
+        m = self.FUNCTION_END_PATTERN.match(line)
         if not m:
             return None
 
@@ -298,16 +505,18 @@ class Linter:
         """
         Return true if line holds operation instructions.
         """
+        stripped = line.strip()
+
         # Ignore comment lines.
-        if self._check_is_comment_line(line):
+        if stripped.startswith('#'):
             return False
 
         # Ignore empty lines.
-        if not line.strip():
+        if not stripped:
             return False
 
         # Ignore empty lines that start sections.
-        if line.strip().startswith('.'):
+        if stripped.startswith('.'):
             return False
 
         # Ignore function title lines.
@@ -316,77 +525,27 @@ class Linter:
 
         return True
 
-    def _check_preamble_program_line(self, line_number, line):
-        parts = list(map(str.strip, line.split(':')))
-        if len(parts) != 2:
-            self._findings.append(Finding(
-                'Invalid "Program Name" line found.',
-                line_number=line_number,
-                source=line,
-            ))
-
-        if parts[0] != 'Program Name':
-            self._findings.append(Finding(
-                'Invalid "Program Name" line found.',
-                line_number=line_number,
-                source=line,
-                columns=(0, len(parts[0])),
-            ))
-
-        if parts[1] != self._file:
-            self._findings.append(Finding(
-                'File in "Program Name" is not equivalent to file name.',
-                line_number=line_number,
-                source=line,
-                columns=(line.index(':') + 2, len(line)),
-            ))
-
-    def _check_preamble_author_line(self, line_number, line):
-        # TODO: Implement a more sophisticated check.
-        pass
-
-    def _check_preamble_date_line(self, line_number, line):
-        # TODO: Implement a more sophisticated check.
-        pass
-
-    def _check_preamble_purpose_line(self, line_number, line):
-        # TODO: Implement a more sophisticated check.
-        pass
-
-    def _check_preamble_functions_line(self, line_number, line):
-        # Get functions from function line.
-        line_functions = set(line.split()[1:])
-
-        # Get functions from file.
-        file_functions = set()
-        for tmp_line in self._lines:
-            if self._check_is_function_line(tmp_line):
-                file_functions.add(tmp_line.strip().rstrip(':'))
-
-        # function in line but not in file
-        missing_functions = line_functions - file_functions
-        if missing_functions:
-            for missing_function in missing_functions:
-                i = line.index(missing_function)
-                self._findings.append(Finding(
-                    f'Function {missing_function} listed in '
-                    'Functions line but not in file.',
-                    line_number=line_number,
-                    source=line,
-                    columns=(i, i + len(missing_function)),
-                ))
-
-        # function in line but not in file
-        missing_functions = file_functions - line_functions
-        if missing_functions:
-            for missing_function in missing_functions:
-                self._findings.append(Finding(
-                    f'Function {missing_function} in file '
-                    'but not listed in Functions line.',
-                    line_number=line_number,
-                    source=line,
-                ))
-
     @property
     def findings(self) -> list[Finding]:
         return self._findings
+
+
+def lint_many(sources, rules=None, **kwargs):
+    """
+    Lint many in-memory files, yielding (file, findings) for each.
+
+    sources is an iterable of (file, source) pairs, taken as by
+    `Linter.from_source`, and is consumed lazily. One linter and one set of
+    rule objects are reused for every file, so there is no per-file setup;
+    each rule's `start` resets it between files. Other keyword arguments
+    are passed to `Linter`.
+    """
+    linter = Linter('stdin.s', rules=rules, **kwargs)
+    linter._checks = linter._with_index([rule() for rule in linter._rules])
+
+    for file, source in sources:
+        linter._file_path = file
+        linter._file = os.path.basename(file)
+        linter._load(source)
+        linter.lint()
+        yield file, linter.findings
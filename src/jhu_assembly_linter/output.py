@@ -0,0 +1,190 @@
+from .finding import Finding
+from .version import get_version
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+
+class Writer:
+    """
+    Buffer rendered findings and write them to stream in large chunks.
+
+    Subclasses render each file's findings through `_format` and may add a
+    `_header`/`_footer` around the whole run.
+    """
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, stream, headers: bool = True) -> None:
+        self.stream = stream
+        self.headers = headers
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._count = 0
+        self._append(self._header())
+
+    def write(self, filename: str, findings: list[tuple]) -> None:
+        if not findings:
+            return
+
+        self._append(self._format(filename, findings))
+        self._count += len(findings)
+
+    def close(self) -> None:
+        self._append(self._footer())
+        self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.stream.write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+        self.stream.flush()
+
+    def _append(self, chunk: str) -> None:
+        if not chunk:
+            return
+
+        self._buffer.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self.BUFFER_SIZE:
+            self.flush()
+
+    def _header(self) -> str:
+        return ''
+
+    def _footer(self) -> str:
+        return ''
+
+    def _format(self, filename: str, findings: list[tuple]) -> str:
+        raise NotImplementedError
+
+
+class TextWriter(Writer):
+    """
+    The human readable caret format.
+    """
+
+    def _format(self, filename, findings):
+        lines = [f'--- {filename}'] if self.headers else []
+        lines.extend(str(Finding.from_tuple(f)) for f in findings)
+        lines.append('')
+        return '\n'.join(lines)
+
+
+class _JsonWriter(Writer):
+    """
+    Base for the JSON formats, which only import json when used.
+    """
+
+    def __init__(self, stream, headers: bool = True) -> None:
+        import json
+
+        # Set first; the header may already need it.
+        self._dumps = json.dumps
+        super().__init__(stream, headers=headers)
+
+
+def _as_dict(filename: str, finding: tuple) -> dict:
+    message, line_number, columns, source, rule = finding
+    return {
+        'file': filename,
+        'rule': rule,
+        'line': line_number,
+        'columns': list(columns),
+        'message': message,
+        'source': source.rstrip('\r\n'),
+    }
+
+
+class JsonLinesWriter(_JsonWriter):
+    """
+    One JSON object per finding, one finding per line.
+    """
+
+    def _format(self, filename, findings):
+        return ''.join(
+            self._dumps(_as_dict(filename, f)) + '\n' for f in findings
+        )
+
+
+class JsonWriter(_JsonWriter):
+    """
+    A single JSON array of findings, streamed as it is built.
+    """
+
+    def _header(self):
+        return '['
+
+    def _footer(self):
+        return ']\n'
+
+    def _format(self, filename, findings):
+        separator = ',' if self._count else ''
+        return separator + ','.join(
+            self._dumps(_as_dict(filename, f)) for f in findings
+        )
+
+
+class SarifWriter(_JsonWriter):
+    """
+    A SARIF 2.1.0 log with a single run, streamed as it is built.
+    """
+
+    def _header(self):
+        log = self._dumps({
+            '$schema': SARIF_SCHEMA,
+            'version': '2.1.0',
+            'runs': [{
+                'tool': {'driver': {
+                    'name': 'jhu-assembly-linter',
+                    'version': get_version(),
+                    'informationUri':
+                        'https://github.com/LogstonGradSchool/'
+                        'JhuAssemblyStyleLinter',
+                }},
+                'results': [],
+            }],
+        })
+        # Leave the results array open so results can be streamed in.
+        self._suffix = log[log.rindex('[]') + 2:] + '\n'
+        return log[:log.rindex('[]') + 1]
+
+    def _footer(self):
+        return ']' + self._suffix
+
+    def _format(self, filename, findings):
+        separator = ',' if self._count else ''
+        return separator + ','.join(
+            self._dumps(self._result(filename, f)) for f in findings
+        )
+
+    def _result(self, filename: str, finding: tuple) -> dict:
+        message, line_number, columns, source, rule = finding
+        location = {'artifactLocation': {'uri': filename}}
+        if line_number:
+            # SARIF columns are 1-based with an exclusive end.
+            region = {'startLine': line_number}
+            if columns:
+                region['startColumn'] = columns[0] + 1
+                region['endColumn'] = (
+                    columns[1] if len(columns) == 2 else columns[0] + 1
+                ) + 1
+            location['region'] = region
+
+        return {
+            'ruleId': rule,
+            'level': 'error',
+            'message': {'text': message},
+            'locations': [{'physicalLocation': location}],
+        }
+
+
+WRITERS = {
+    'text': TextWriter,
+    'jsonl': JsonLinesWriter,
+    'json': JsonWriter,
+    'sarif': SarifWriter,
+}
+
+
+def get_writer(name: str, stream, headers: bool = True) -> Writer:
+    return WRITERS[name](stream, headers=headers)
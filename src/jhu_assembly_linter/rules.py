@@ -0,0 +1,506 @@
+import re
+import string
+
+from .finding import Finding
+from .instruction import is_register
+from .line import BLANK, DIRECTIVE, INSTRUCTION, Line
+
+
+class Rule:
+    """
+    A check run as a state machine fed one classified line at a time.
+
+    `start` resets the state for a new file, `feed` is called in order for
+    each line whose kind is in `kinds` (every line if None, none if empty)
+    and `finish` reports anything that needs the whole file. Rules that
+    only look at the raw text set `classify` to False so lines need not be
+    classified for them. Rules whose findings for a line depend on that
+    line alone set `per_line` so edits only re-check the changed lines.
+    Rules that set `uses_index` can query the file's `LabelIndex` from
+    `finish` instead of collecting labels themselves.
+
+    Findings are added through `report`, which drops them once the
+    linter's `max_findings` is used up and only counts them if the linter
+    was given `counts`.
+
+    Rules that set `scans` can check whole blocks of lines at once with
+    `scan`, which the linter uses instead of `feed` when it has the text.
+    """
+    id = ''
+    kinds = None
+    classify = True
+    per_line = False
+    uses_index = False
+    scans = False
+
+    def start(self, linter) -> None:
+        self.linter = linter
+        self.findings: list[Finding] = []
+
+    def report(self, message: str, **kwargs) -> None:
+        linter = self.linter
+        if linter._remaining is not None:
+            if linter._remaining <= 0:
+                return
+            linter._remaining -= 1
+        if linter._counts is not None:
+            linter._counts[self.id] = linter._counts.get(self.id, 0) + 1
+            return
+        self.findings.append(Finding(message, rule=self.id, **kwargs))
+
+    def feed(self, record: Line) -> None:
+        pass
+
+    def scan(self, text: str, number: int) -> None:
+        """
+        Check text, whole lines starting with line number, as `feed` would.
+        """
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        pass
+
+
+# Characters allowed in file names.
+FILE_NAME_CHARACTERS = frozenset(string.ascii_letters + string.digits)
+
+
+def _line_at(text: str, start: int) -> str:
+    """
+    Return the line of text starting at offset start, with its newline.
+    """
+    end = text.find('\n', start)
+    return text[start:] if end < 0 else text[start:end + 1]
+
+
+class PreambleRule(Rule):
+    """
+    Ensure the preamble is present and well formatted.
+    """
+    id = 'preamble'
+    uses_index = True
+
+    def start(self, linter) -> None:
+        super().start(linter)
+        self.preamble = []
+        self.in_preamble = True
+
+    def feed(self, record: Line) -> None:
+        if not self.in_preamble:
+            return
+
+        if record.is_comment:
+            self.preamble.append(
+                (record.number, record.stripped.lstrip('#').lstrip()),
+            )
+        else:
+            self.in_preamble = False
+
+    def finish(self) -> None:
+        line_by_key: dict[str, tuple] = {}
+        for i, line in self.preamble:
+            key = line.split()
+            if not key:
+                continue
+
+            key = key[0].rstrip(':').strip().lower()
+            line_by_key[key] = (i, line)
+
+        program_line = line_by_key.get('program') or ()
+        if not program_line:
+            self.report(
+                'Preamble error: No "Program Name" line found.',
+            )
+        else:
+            self._check_program_line(*program_line)
+
+        author_line = line_by_key.get('author')
+        if not author_line:
+            self.report(
+                'Preamble error: No "Author" line found.',
+            )
+        else:
+            self._check_author_line(*author_line)
+
+        date_line = line_by_key.get('date')
+        if not date_line:
+            self.report(
+                'Preamble error: No "Date" line found.',
+            )
+        else:
+            self._check_date_line(*date_line)
+
+        purpose_line = line_by_key.get('purpose')
+        if not purpose_line:
+            self.report(
+                'Preamble error: No "Purpose" line found.',
+            )
+        else:
+            self._check_purpose_line(*purpose_line)
+
+        functions_line = line_by_key.get('functions')
+        if not functions_line:
+            self.report(
+                'Preamble error: No "Functions" line found.',
+            )
+        else:
+            self._check_functions_line(*functions_line)
+
+    def _check_program_line(self, line_number, line):
+        parts = list(map(str.strip, line.split(':')))
+        if len(parts) != 2:
+            self.report(
+                'Invalid "Program Name" line found.',
+                line_number=line_number,
+                source=line,
+            )
+
+        if parts[0] != 'Program Name':
+            self.report(
+                'Invalid "Program Name" line found.',
+                line_number=line_number,
+                source=line,
+                columns=(0, len(parts[0])),
+            )
+
+        if parts[1] != self.linter._file:
+            self.report(
+                'File in "Program Name" is not equivalent to file name.',
+                line_number=line_number,
+                source=line,
+                columns=(line.index(':') + 2, len(line)),
+            )
+
+    def _check_author_line(self, line_number, line):
+        # TODO: Implement a more sophisticated check.
+        pass
+
+    def _check_date_line(self, line_number, line):
+        # TODO: Implement a more sophisticated check.
+        pass
+
+    def _check_purpose_line(self, line_number, line):
+        # TODO: Implement a more sophisticated check.
+        pass
+
+    def _check_functions_line(self, line_number, line):
+        # Get functions from function line.
+        line_functions = set(line.split()[1:])
+
+        # Get functions from file.
+        file_functions = self.linter._index.function_names
+
+        # function in line but not in file
+        missing_functions = line_functions - file_functions
+        if missing_functions:
+            for missing_function in missing_functions:
+                i = line.index(missing_function)
+                self.report(
+                    f'Function {missing_function} listed in '
+                    'Functions line but not in file.',
+                    line_number=line_number,
+                    source=line,
+                    columns=(i, i + len(missing_function)),
+                )
+
+        # function in line but not in file
+        missing_functions = file_functions - line_functions
+        if missing_functions:
+            for missing_function in missing_functions:
+                self.report(
+                    f'Function {missing_function} in file '
+                    'but not listed in Functions line.',
+                    line_number=line_number,
+                    source=line,
+                )
+
+
+class FileNameRule(Rule):
+    """
+    Check the file name follows the correct conventions.
+    """
+    id = 'file-name'
+    kinds = frozenset()
+
+    def finish(self) -> None:
+        name = self.linter._file[:-2]
+
+        invalidChars = set(name) - FILE_NAME_CHARACTERS
+        if invalidChars:
+            self.report(
+                f'File name contains invalid characters: {invalidChars}',
+            )
+
+        if name[0] not in string.ascii_lowercase:
+            self.report(
+                'File starts with non-lowercase letter.',
+            )
+
+
+class FileNameMainRule(Rule):
+    """
+    Check that if file has "main" function, it has "Main" in its name.
+    """
+    id = 'file-name-main'
+    kinds = frozenset()
+    uses_index = True
+
+    def finish(self) -> None:
+        main = self.linter._index.first_label('main')
+        if main:
+            if not self.linter._file.endswith('Main.s'):
+                self.report(
+                    'File name does not end with "Main" when it should.',
+                    line_number=main.record.number,
+                    source=main.record.text,
+                )
+        elif self.linter._file.endswith('Main.s'):
+            self.report(
+                'File name ends with "Main" but no main function found.',
+            )
+
+
+class DataSectionRule(Rule):
+    """
+    Check that all data sections follow text sections.
+    """
+    id = 'data-section'
+    kinds = frozenset((DIRECTIVE,))
+
+    def start(self, linter) -> None:
+        super().start(linter)
+        # TODO: Make this reset on new functions.
+        self.can_see_data = False
+
+    def feed(self, record: Line) -> None:
+        if record.stripped.startswith('.text'):
+            self.can_see_data = True
+            return
+
+        if record.stripped.startswith('.data'):
+            if self.can_see_data:
+                self.can_see_data = False
+            else:
+                self.report(
+                    'Data sections must follow a text section.',
+                    line_number=record.number,
+                    source=record.text,
+                )
+
+
+class FunctionEndRule(Rule):
+    """
+    Check that each function has an END comment.
+    """
+    id = 'function-end'
+    kinds = frozenset()
+    uses_index = True
+
+    def finish(self) -> None:
+        index = self.linter._index
+
+        functions = {}
+        # Lines after .text that should have been a function name, so that
+        # an END marker there is not reported a second time.
+        misplaced = set()
+        for section in index.sections:
+            record = section.first
+            if record is None:
+                continue
+
+            if not record.label:
+                self.report(
+                    'Expected function name after .text block start.',
+                    line_number=record.number,
+                    source=record.text,
+                )
+                misplaced.add(record.number)
+                continue
+
+            # Main function is ignored.
+            if record.label != 'main':
+                functions.setdefault(record.label, record)
+
+        ends = [
+            (name, record) for name, record in index.ends
+            if record.number not in misplaced
+        ]
+        end_names = {name for name, _ in ends}
+        for name, record in functions.items():
+            if name not in end_names:
+                self.report(
+                    f'Function {name} missing END comment.',
+                    line_number=record.number,
+                    source=record.text,
+                )
+
+        for name, record in ends:
+            if name not in functions:
+                self.report(
+                    f'END comment for {name} without associated function.',
+                    line_number=record.number,
+                    source=record.text,
+                )
+
+
+class InstructionCaseRule(Rule):
+    """
+    Check that instructions are uppercase.
+    """
+    id = 'instruction-case'
+    kinds = frozenset((INSTRUCTION,))
+    per_line = True
+
+    def feed(self, record: Line) -> None:
+        mnemonic = record.instruction[0]
+        if mnemonic is None:
+            # A line holding only a comment.
+            return
+
+        start, end = mnemonic
+        if not record.text[start:end].isupper():
+            self.report(
+                'Instruction is not uppercase.',
+                line_number=record.number,
+                columns=(start,),
+                source=record.text,
+            )
+
+
+class RegisterCaseRule(Rule):
+    """
+    Check registers are listed in lowercase.
+    """
+    id = 'register-case'
+    kinds = frozenset((INSTRUCTION,))
+    per_line = True
+
+    def feed(self, record: Line) -> None:
+        line = record.text
+        operands = record.instruction[1]
+        if not operands:
+            return
+
+        # Most lines have no uppercase operands at all.
+        text = line[operands[0][0]:operands[-1][1]]
+        if text.lower() == text:
+            return
+
+        for start, end in operands:
+            token = line[start:end]
+            if not token.islower() and is_register(token):
+                self.report(
+                    'Register is not lowercase.',
+                    line_number=record.number,
+                    columns=(start, end),
+                    source=line,
+                )
+
+
+class EmptyLineWhitespaceRule(Rule):
+    """
+    Check check that empty lines have no trailing whitespace.
+    """
+    id = 'blank-whitespace'
+    kinds = frozenset((BLANK,))
+    per_line = True
+    scans = True
+    # A whole line of whitespace other than the newline.
+    PATTERN = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+
+    def feed(self, record: Line) -> None:
+        line = record.text
+        tmp_line = line.replace('\r', '').replace('\n', '')
+        if len(tmp_line) > 0:
+            self.report(
+                'Non-functional whitespace found.',
+                line_number=record.number,
+                columns=(0, len(line)),
+                source=line,
+            )
+
+    def scan(self, text: str, number: int) -> None:
+        offset = 0
+        for match in self.PATTERN.finditer(text):
+            start = match.start()
+            number += text.count('\n', offset, start)
+            offset = start
+            line = _line_at(text, start)
+            self.report(
+                'Non-functional whitespace found.',
+                line_number=number,
+                columns=(0, len(line)),
+                source=line,
+            )
+
+
+class TabRule(Rule):
+    """
+    Check each line to check that it does not have tabs.
+    """
+    id = 'tab'
+    classify = False
+    per_line = True
+    scans = True
+
+    def feed(self, record: Line) -> None:
+        column = record.text.find('\t')
+        if column >= 0:
+            self.report(
+                'Tab found. Only spaces allowed.',
+                line_number=record.number,
+                columns=(column,),
+                source=record.text,
+            )
+
+    def scan(self, text: str, number: int) -> None:
+        # Only lines with a tab are sliced out of text.
+        find = text.find
+        offset = 0
+        tab = find('\t')
+        while tab >= 0:
+            number += text.count('\n', offset, tab)
+            offset = text.rfind('\n', offset, tab) + 1 or offset
+            line = _line_at(text, offset)
+            self.report(
+                'Tab found. Only spaces allowed.',
+                line_number=number,
+                columns=(tab - offset,),
+                source=line,
+            )
+            tab = find('\t', offset + len(line))
+
+
+# In the order findings are reported.
+RULES = (
+    PreambleRule,
+    FileNameRule,
+    FileNameMainRule,
+    DataSectionRule,
+    FunctionEndRule,
+    InstructionCaseRule,
+    RegisterCaseRule,
+    EmptyLineWhitespaceRule,
+    TabRule,
+)
+
+REGISTRY = {rule.id: rule for rule in RULES}
+
+
+def select_rules(select=None, ignore=()) -> tuple:
+    """
+    Return the registered rules, in order, filtered by rule ID.
+
+    Only rules in select (all if None) and not in ignore are returned.
+    Unknown IDs raise a ValueError.
+    """
+    unknown = (set(select or ()) | set(ignore)) - REGISTRY.keys()
+    if unknown:
+        raise ValueError(
+            f'Unknown rule ID(s): {", ".join(sorted(unknown))}',
+        )
+
+    return tuple(
+        rule for rule in RULES
+        if (select is None or rule.id in select) and rule.id not in ignore
+    )
@@ -0,0 +1,119 @@
+import os
+
+from .linter import Linter
+
+
+def lint_file(
+    filename: str,
+    cache=None,
+    rules=None,
+    stats=None,
+    max_findings=None,
+    count=False,
+):
+    """
+    Lint a single file, returning its findings in compact tuple form, or
+    their counts by rule ID with count.
+
+    The file is streamed whether or not a cache is used: its key is hashed
+    in blocks and, on a miss, it is linted one line at a time.
+    """
+    key = None
+    if cache:
+        key = cache.file_key(
+            filename, os.path.basename(filename), rule_ids=_rule_ids(rules),
+        )
+        findings = _cached(cache, key, stats, max_findings, count)
+        if findings is not None:
+            return findings
+
+    counts = {} if count and not cache else None
+    linter = Linter(
+        filename,
+        rules=rules,
+        stats=stats,
+        max_findings=max_findings,
+        counts=counts,
+    )
+    return _lint(linter, counts, cache, key, max_findings, count)
+
+
+def lint_source(
+    filename: str,
+    content: bytes,
+    cache=None,
+    rules=None,
+    stats=None,
+    max_findings=None,
+    count=False,
+    file_name=None,
+):
+    """
+    Lint in-memory content, returning its findings in compact tuple form.
+
+    file_name is the name the file name rules check, by default the base
+    name of filename. Results are looked up in and stored to cache, a
+    `Cache`, if given. With max_findings, only that many findings are
+    looked for. With count, a dict of finding counts by rule ID is returned
+    instead; findings are then only built if they are to be cached.
+    """
+    file_name = file_name or os.path.basename(filename)
+    key = None
+    if cache:
+        key = cache.key(content, file_name, rule_ids=_rule_ids(rules))
+        findings = _cached(cache, key, stats, max_findings, count)
+        if findings is not None:
+            return findings
+
+    counts = {} if count and not cache else None
+    linter = Linter.from_source(
+        content,
+        file=file_name,
+        rules=rules,
+        stats=stats,
+        max_findings=max_findings,
+        counts=counts,
+    )
+    return _lint(linter, counts, cache, key, max_findings, count)
+
+
+def _rule_ids(rules) -> list[str]:
+    return [rule.id for rule in rules or ()]
+
+
+def _cached(cache, key: str, stats, max_findings, count):
+    """
+    Return the cached results for key as `lint_source` would, or None.
+    """
+    findings = cache.get(key)
+    if findings is None:
+        return None
+
+    if stats is not None:
+        stats.files += 1
+        stats.cached += 1
+    findings = findings[:max_findings]
+    return _count_findings(findings) if count else findings
+
+
+def _lint(linter: Linter, counts, cache, key: str, max_findings, count):
+    """
+    Lint with linter, storing the findings to cache under key if given.
+    """
+    linter.lint()
+    if counts is not None:
+        return counts
+
+    findings = [f.as_tuple() for f in linter.findings]
+
+    # Findings cut short by max_findings are not the file's full results.
+    if cache and (max_findings is None or len(findings) < max_findings):
+        cache.set(key, findings)
+
+    return _count_findings(findings) if count else findings
+
+
+def _count_findings(findings: list[tuple]) -> dict:
+    from .summary import count_findings
+
+    return count_findings(findings)
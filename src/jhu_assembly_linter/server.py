@@ -0,0 +1,128 @@
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+from .client import default_socket_path
+from .linter import Linter
+
+
+def _string(request: dict, key: str, default: str = None) -> str:
+    value = request.get(key, default)
+    if not isinstance(value, str):
+        raise ValueError(f'"{key}" must be a string')
+    return value
+
+
+def handle_request(request: dict) -> dict:
+    """
+    Lint the path or source named in request and return the response.
+
+    Any error, including a malformed request, is returned as the response
+    so that the connection keeps being served.
+    """
+    try:
+        if not isinstance(request, dict):
+            raise ValueError('request must be a JSON object')
+
+        if 'path' in request:
+            linter = Linter(_string(request, 'path'))
+        else:
+            file = _string(request, 'file', 'stdin.s')
+            if not file:
+                raise ValueError('"file" must not be empty')
+
+            linter = Linter.from_source(_string(request, 'source'), file=file)
+        linter.lint()
+    except Exception as e:
+        return {'error': f'{type(e).__name__}: {e}'}
+
+    return {'findings': [f.as_tuple() for f in linter.findings]}
+
+
+class LintRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {'error': f'Invalid request: {e}'}
+            else:
+                response = handle_request(request)
+
+            self.wfile.write(json.dumps(response).encode() + b'\n')
+            self.wfile.flush()
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Remove socket_path if it is a socket left behind by a dead server.
+
+    Raises FileExistsError if it is anything else or a server is still
+    listening on it.
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+
+    if stat.S_ISSOCK(mode):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except ConnectionRefusedError:
+                os.remove(socket_path)
+                return
+
+        raise FileExistsError(f'A server is listening on {socket_path}')
+
+    raise FileExistsError(f'{socket_path} exists and is not a socket')
+
+
+class LintServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str) -> None:
+        _remove_stale_socket(socket_path)
+
+        super().__init__(socket_path, LintRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        'Keep the JHU assembly linter loaded and serve lint requests',
+    )
+    parser.add_argument(
+        '--socket',
+        help='Path of the Unix socket to listen on',
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        server = LintServer(args.socket or default_socket_path(create=True))
+    except OSError as e:
+        parser.error(str(e))
+
+    # Exit cleanly, removing the socket, when asked to stop.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
@@ -0,0 +1,93 @@
+class RuleStats:
+    """
+    Wall time, lines fed and findings reported by one rule.
+    """
+    __slots__ = ('seconds', 'lines', 'findings')
+
+    def __init__(
+        self,
+        seconds: float = 0.0,
+        lines: int = 0,
+        findings: int = 0,
+    ) -> None:
+        self.seconds = seconds
+        self.lines = lines
+        self.findings = findings
+
+    def as_tuple(self) -> tuple:
+        return (self.seconds, self.lines, self.findings)
+
+    def merge(self, other: 'RuleStats') -> None:
+        self.seconds += other.seconds
+        self.lines += other.lines
+        self.findings += other.findings
+
+
+class LintStats:
+    """
+    Per-rule counters for one or more linted files.
+
+    Pass an instance to `Linter` to have `lint()` record into it. Stats from
+    several files, or worker processes via `as_dict`, can be merged.
+    """
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.cached = 0
+        self.rules: dict[str, RuleStats] = {}
+
+    def rule(self, rule_id: str) -> RuleStats:
+        stats = self.rules.get(rule_id)
+        if stats is None:
+            stats = self.rules[rule_id] = RuleStats()
+        return stats
+
+    def merge(self, other: 'LintStats') -> None:
+        self.files += other.files
+        self.cached += other.cached
+        for rule_id, stats in other.rules.items():
+            self.rule(rule_id).merge(stats)
+
+    def as_dict(self) -> dict:
+        """
+        Return a compact, picklable form of these stats.
+        """
+        return {
+            'files': self.files,
+            'cached': self.cached,
+            'rules': {
+                rule_id: stats.as_tuple()
+                for rule_id, stats in self.rules.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LintStats':
+        stats = cls()
+        stats.files = data['files']
+        stats.cached = data['cached']
+        for rule_id, values in data['rules'].items():
+            stats.rules[rule_id] = RuleStats(*values)
+        return stats
+
+    def format_table(self) -> str:
+        total = sum(stats.seconds for stats in self.rules.values()) or 1
+        header = (
+            f'{"rule":<20} {"time ms":>10} {"share":>6} '
+            f'{"lines":>10} {"findings":>9}'
+        )
+        rows = [
+            f'Linted {self.files} file(s), {self.cached} from cache',
+            header,
+            '-' * len(header),
+        ]
+        ordered = sorted(
+            self.rules.items(), key=lambda item: item[1].seconds, reverse=True,
+        )
+        for rule_id, stats in ordered:
+            rows.append(
+                f'{rule_id:<20} {stats.seconds * 1000:>10.2f} '
+                f'{stats.seconds / total:>6.1%} '
+                f'{stats.lines:>10} {stats.findings:>9}'
+            )
+        return '\n'.join(rows)
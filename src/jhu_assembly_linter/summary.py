@@ -0,0 +1,62 @@
+import heapq
+
+
+def count_findings(findings: list[tuple]) -> dict[str, int]:
+    """
+    Count findings in compact tuple form by rule ID.
+    """
+    counts: dict[str, int] = {}
+    for finding in findings:
+        rule = finding[4]
+        counts[rule] = counts.get(rule, 0) + 1
+    return counts
+
+
+class Summary:
+    """
+    Finding counts per rule and per file for a whole run.
+    """
+
+    def __init__(self) -> None:
+        self.files = 0
+        self.rules: dict[str, int] = {}
+        # Total findings of each file that has any.
+        self.file_totals: dict[str, int] = {}
+
+    def add(self, filename: str, counts: dict[str, int]) -> None:
+        self.files += 1
+        total = 0
+        for rule, count in counts.items():
+            self.rules[rule] = self.rules.get(rule, 0) + count
+            total += count
+        if total:
+            self.file_totals[filename] = total
+
+    @property
+    def total(self) -> int:
+        return sum(self.rules.values())
+
+    def format_table(self, top: int = 0) -> str:
+        width = max([20] + [len(rule) for rule in self.rules])
+        rows = [
+            f'{"rule":<{width}} {"findings":>10}',
+            '-' * (width + 11),
+        ]
+        ordered = sorted(self.rules.items(), key=lambda item: -item[1])
+        for rule, count in ordered:
+            rows.append(f'{rule:<{width}} {count:>10}')
+        rows.append(
+            f'{self.total} finding(s) in {len(self.file_totals)} of '
+            f'{self.files} file(s)',
+        )
+
+        if top and self.file_totals:
+            rows.append('')
+            rows.append(f'Top {top} file(s):')
+            worst = heapq.nlargest(
+                top, self.file_totals.items(), key=lambda item: item[1],
+            )
+            for filename, count in worst:
+                rows.append(f'{count:>10} {filename}')
+
+        return '\n'.join(rows)
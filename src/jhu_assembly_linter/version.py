@@ -0,0 +1,10 @@
+def get_version() -> str:
+    """
+    Return the installed version of the linter.
+    """
+    from importlib import metadata
+
+    try:
+        return metadata.version('jhu-assembly-linter')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
@@ -0,0 +1,22 @@
+"""
+Helpers shared by the test modules.
+"""
+
+GOOD_SOURCE = '''\
+# Program Name: {name}
+# Author: John Doe
+# Date: 11/11/2020
+# Purpose: To add numbers.
+# Functions: add
+
+.text
+add:
+    MOV r0, r0
+# END add
+'''
+
+
+def write(path, name, source=GOOD_SOURCE):
+    file = path / name
+    file.write_text(source.format(name=name))
+    return str(file)
@@ -0,0 +1,76 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from jhu_assembly_linter import aio
+from jhu_assembly_linter.linter import Linter
+from tests.helpers import GOOD_SOURCE, write
+
+
+async def collect(*args, **kwargs):
+    return [result async for result in aio.lint_paths(*args, **kwargs)]
+
+
+def test_lint_paths(tmp_path):
+    files = [
+        write(tmp_path, 'addOne.s'),
+        write(tmp_path, 'addTwo.s', GOOD_SOURCE.replace('    ', '\t')),
+    ]
+
+    results = dict(asyncio.run(collect(files)))
+
+    assert set(results) == set(files)
+    assert results[files[0]] == []
+    expected = Linter(files[1])
+    expected.lint()
+    assert results[files[1]] == [f.as_tuple() for f in expected.findings]
+
+
+def test_lint_paths_backpressure(tmp_path):
+    files = [write(tmp_path, f'add{i}.s') for i in range(10)]
+    started = []
+
+    def paths():
+        for path in files:
+            started.append(path)
+            yield path
+
+    async def first():
+        with ThreadPoolExecutor(2) as executor:
+            results = aio.lint_paths(paths(), executor=executor, limit=2)
+            await results.__anext__()
+            # Give the producer a chance to run ahead if it could.
+            await asyncio.sleep(0.05)
+            count = len(started)
+            await results.aclose()
+            return count
+
+    # Two files in flight plus the one just released.
+    assert asyncio.run(first()) <= 3
+
+
+def test_lint_paths_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        asyncio.run(collect([str(tmp_path / 'missing.s')]))
+
+
+def test_lint_paths_own_executor(tmp_path, monkeypatch):
+    files = [write(tmp_path, f'add{i}.s') for i in range(3)]
+    executors = []
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        run_in_executor = loop.run_in_executor
+
+        def record(executor, *args):
+            executors.append(executor)
+            return run_in_executor(executor, *args)
+
+        monkeypatch.setattr(loop, 'run_in_executor', record)
+        return await collect(files)
+
+    assert sorted(asyncio.run(run())) == [(path, []) for path in files]
+    # Linting runs in worker processes, not the loop's default executor.
+    assert len(executors) == 3
+    assert all(isinstance(e, ProcessPoolExecutor) for e in executors)
@@ -0,0 +1,109 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from jhu_assembly_linter import archive, cmd
+from jhu_assembly_linter.archive import is_archive, iter_members
+from tests.helpers import GOOD_SOURCE
+
+MEMBERS = {
+    'sub/addOne.s': GOOD_SOURCE.format(name='addOne.s'),
+    'sub/Bad_Name.s': GOOD_SOURCE.format(name='Bad_Name.s'),
+    'notes.txt': 'Not assembly\t\n',
+}
+
+
+def write_zip(path):
+    with zipfile.ZipFile(path, 'w') as archive:
+        for name, source in MEMBERS.items():
+            archive.writestr(name, source)
+    return str(path)
+
+
+def write_tar(path):
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, source in MEMBERS.items():
+            data = source.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+def test_is_archive():
+    assert is_archive('a.zip')
+    assert is_archive('dir/a.TAR.GZ')
+    assert is_archive('a.tgz')
+    assert not is_archive('a.s')
+    assert not is_archive('a.gz')
+
+
+@pytest.mark.parametrize('write', [write_zip, write_tar])
+def test_iter_members(tmp_path, write):
+    path = write(tmp_path / f'submission.{write.__name__[6:]}')
+
+    members = list(iter_members(path))
+    assert [(display, name) for display, name, _ in members] == [
+        (f'{path}:sub/addOne.s', 'addOne.s'),
+        (f'{path}:sub/Bad_Name.s', 'Bad_Name.s'),
+    ]
+    assert members[0][2] == MEMBERS['sub/addOne.s'].encode()
+
+    assert list(iter_members(path, exclude=['Bad*'])) == members[:1]
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_multi_archives(tmp_path, capsys, jobs):
+    archives = [
+        write_zip(tmp_path / 'first.zip'),
+        write_tar(tmp_path / 'second.tar.gz'),
+    ]
+
+    assert cmd.multi(['--jobs', jobs] + archives) == 1
+    out = capsys.readouterr().out
+    headers = [line for line in out.splitlines() if line.startswith('---')]
+    # Only the badly named member has findings, checked by member name.
+    assert headers == [f'--- {path}:sub/Bad_Name.s' for path in archives]
+    assert 'E:: File starts with non-lowercase letter.' in out
+
+
+@pytest.mark.parametrize('pattern', ['**/*.zip', 'sub/*.zip', 'sub', '.'])
+def test_multi_archives_found(tmp_path, monkeypatch, capsys, pattern):
+    (tmp_path / 'sub').mkdir()
+    write_zip(tmp_path / 'sub' / 'first.zip')
+    monkeypatch.chdir(tmp_path)
+
+    # Archives found by globs and in directories are not filtered out by
+    # the default "*.s" include pattern.
+    assert cmd.multi([pattern]) == 1
+    assert 'Bad_Name.s' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('name', ['bad.zip', 'bad.tar.gz'])
+def test_multi_invalid_archive(tmp_path, capsys, name):
+    bad = tmp_path / name
+    bad.write_bytes(b'Not an archive')
+    good = write_zip(tmp_path / 'good.zip')
+
+    # The good archive is still linted, but the run fails.
+    assert cmd.multi(['--jobs', '1', str(bad), good]) == 1
+    captured = capsys.readouterr()
+    assert captured.err.startswith(f'{bad}: ')
+    assert f'--- {good}:sub/Bad_Name.s' in captured.out
+
+    with pytest.raises(ValueError):
+        list(iter_members(str(bad)))
+
+
+def test_multi_archive_member_too_large(tmp_path, capsys, monkeypatch):
+    path = write_zip(tmp_path / 'first.zip')
+    size = len(MEMBERS['sub/addOne.s'].encode())
+    monkeypatch.setattr(archive, 'MAX_MEMBER_SIZE', size - 1)
+
+    assert [name for _, name, _ in iter_members(path, on_error=print)] == []
+    assert cmd.multi([path]) == 1
+    err = capsys.readouterr().err
+    assert f'{path}:sub/addOne.s: Skipped, larger than' in err
+    assert f'{path}:sub/Bad_Name.s: Skipped, larger than' in err
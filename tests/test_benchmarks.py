@@ -0,0 +1,35 @@
+from benchmarks import corpus, run
+from jhu_assembly_linter.linter import Linter
+
+
+def test_generate_source():
+    source = corpus.generate_source('bench.s', lines=300, violations=0.1)
+    assert source == corpus.generate_source('bench.s', lines=300,
+                                            violations=0.1)
+    assert 250 < source.count('\n') < 350
+
+    linter = Linter.from_source(source, file='bench.s')
+    linter.lint()
+    assert {'tab', 'instruction-case', 'register-case'} <= \
+        {f.rule for f in linter.findings}
+
+    clean = Linter.from_source(
+        corpus.generate_source('bench.s', violations=0), file='bench.s',
+    )
+    clean.lint()
+    assert clean.findings == []
+
+
+def test_run_benchmarks(tmp_path):
+    paths = corpus.write_corpus(str(tmp_path), files=3, lines=50)
+    names = ['lint', 'rule:tab', 'classify', 'classify-uncompiled']
+    results = run.run_benchmarks(paths, repeat=1, names=names)
+
+    assert list(results) == names
+    assert results['lint']['files_per_sec'] > 0
+
+    assert results['lint']['worker_peak_rss'] == 0
+
+    table = run.format_results(results, baseline=results)
+    assert '+0.0%' in table
+    assert 'wkr MB' in table
@@ -0,0 +1,136 @@
+import os
+import time
+
+from jhu_assembly_linter import cache as cache_module
+from jhu_assembly_linter import cmd, runner
+from jhu_assembly_linter.cache import Cache
+from jhu_assembly_linter.linter import Linter
+
+
+def test_cache_key(tmp_path, monkeypatch):
+    cache = Cache(str(tmp_path))
+    cache.version = '1.0'
+
+    key = cache.key(b'MOV r0, r0\n', 'addMain.s')
+    assert key == cache.key(b'MOV r0, r0\n', 'addMain.s')
+    # Content, file name and linter version are all part of the key.
+    assert key != cache.key(b'MOV r1, r1\n', 'addMain.s')
+    assert key != cache.key(b'MOV r0, r0\n', 'add.s')
+    cache.version = '2.0'
+    assert key != cache.key(b'MOV r0, r0\n', 'addMain.s')
+
+    path = tmp_path / 'addMain.s'
+    path.write_bytes(b'MOV r0, r0\n' * 1000)
+    monkeypatch.setattr(cache_module, 'READ_SIZE', 64)
+    assert cache.file_key(str(path), 'addMain.s') == \
+        cache.key(path.read_bytes(), 'addMain.s')
+
+
+def test_cache_get_set(tmp_path):
+    cache = Cache(str(tmp_path))
+    assert cache.get('missing') is None
+
+    findings = [
+        ('Tab found.', 3, (0,), '\tMOV r0, r0\n', 'tab'),
+        ('Bad.', 0, (), '', 'file-name'),
+    ]
+    cache.set('key', findings)
+    assert cache.get('key') == findings
+
+
+def test_cache_prune_evicts_least_recently_used(tmp_path):
+    cache = Cache(str(tmp_path))
+    for i, key in enumerate(('old', 'used', 'new')):
+        cache.set(key, [('x' * 100, 0, (), '', 'tab')])
+        os.utime(cache._path(key), (i, i))
+
+    entry_size = os.path.getsize(cache._path('old'))
+    cache.max_size = entry_size * 2
+
+    assert cache.get('used') is not None  # Marks as recently used.
+    cache.prune()
+
+    assert cache.get('old') is None
+    assert cache.get('used') is not None
+    assert cache.get('new') is not None
+
+
+def test_cache_prune_removes_stale_tmp_files(tmp_path):
+    cache = Cache(str(tmp_path))
+    stale = tmp_path / 'tmpstale'
+    stale.write_text('[')
+    old = time.time() - cache_module.STALE_TMP_AGE - 1
+    os.utime(stale, (old, old))
+    writing = tmp_path / 'tmpwriting'
+    writing.write_text('[')
+
+    cache.prune()
+
+    assert not stale.exists()
+    assert writing.exists()
+
+
+def test_cache_set_prunes_in_proportion(tmp_path, monkeypatch):
+    pruned = []
+    monkeypatch.setattr(Cache, 'prune', lambda self: pruned.append(1))
+    monkeypatch.setattr(cache_module.random, 'random', lambda: 0.99)
+    cache = Cache(str(tmp_path))
+    findings = [('x' * 100, 0, (), '', 'tab')]
+    cache.set('key', findings)
+    assert pruned == []
+
+    # Each write of a twentieth of max_size prunes half the time.
+    size = os.path.getsize(cache._path('key'))
+    cache.max_size = size * cache_module.PRUNES_PER_MAX_SIZE * 2
+    monkeypatch.setattr(cache_module.random, 'random', lambda: 0.6)
+    cache.set('key', findings)
+    assert pruned == []
+    monkeypatch.setattr(cache_module.random, 'random', lambda: 0.4)
+    cache.set('key', findings)
+    assert pruned == [1]
+
+
+def test_multi_uses_cache(tmp_path, capsys, monkeypatch):
+    source = tmp_path / 'addTwo.s'
+    source.write_text('\tMOV r0, r0\n')
+    cache_dir = str(tmp_path / 'cache')
+    argv = ['--jobs', '1', '--cache-dir', cache_dir, str(source)]
+
+    assert cmd.multi(argv) == 1
+    first = capsys.readouterr().out
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Linter.lint() called on a cache hit.')
+
+    monkeypatch.setattr(Linter, 'lint', fail)
+    assert cmd.multi(argv) == 1
+    assert capsys.readouterr().out == first
+
+
+def test_main_cache_hits_do_not_prune(tmp_path, capsys, monkeypatch):
+    source = tmp_path / 'addTwo.s'
+    source.write_text('\tMOV r0, r0\n')
+    argv = ['--cache-dir', str(tmp_path / 'cache'), str(source)]
+    cmd.main(argv)
+
+    def fail(self):
+        raise AssertionError('Cache.prune() called without writes.')
+
+    monkeypatch.setattr(Cache, 'prune', fail)
+    cmd.main(argv)
+    assert capsys.readouterr().out.count('Tab found.') == 2
+
+
+def test_lint_file_cache_miss_streams(tmp_path, monkeypatch):
+    source = tmp_path / 'addTwo.s'
+    source.write_text('\tMOV r0, r0\n')
+    cache = Cache(str(tmp_path / 'cache'))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('File read into memory.')
+
+    monkeypatch.setattr(Linter, 'from_source', fail)
+    findings = runner.lint_file(str(source), cache=cache)
+    assert ('Tab found. Only spaces allowed.', 1, (0,), '\tMOV r0, r0\n',
+            'tab') in findings
+    assert runner.lint_file(str(source), cache=cache) == findings
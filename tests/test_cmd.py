@@ -0,0 +1,72 @@
+import pytest
+
+from jhu_assembly_linter import cmd
+from tests.helpers import GOOD_SOURCE, write
+
+
+def test_multi_no_findings(tmp_path, capsys):
+    files = [write(tmp_path, 'addOne.s'), write(tmp_path, 'addTwo.s')]
+    assert cmd.multi(files) == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_multi_jobs_keeps_input_order(tmp_path, capsys):
+    files = [
+        write(tmp_path, f'bad{i}.s', GOOD_SOURCE.replace('    ', '\t'))
+        for i in range(6)
+    ]
+
+    assert cmd.multi(['--jobs', '1'] + files) == 1
+    serial = capsys.readouterr().out
+
+    assert cmd.multi(['--jobs', '3'] + files) == 1
+    parallel = capsys.readouterr().out
+
+    assert serial == parallel
+    headers = [line for line in serial.splitlines() if line.startswith('---')]
+    assert headers == [f'--- {f}' for f in files]
+
+
+def test_main_stdin(monkeypatch, capsys):
+    import io
+    import sys
+
+    source = GOOD_SOURCE.format(name='addOne.s').replace('    ', '\t')
+    monkeypatch.setattr(
+        sys, 'stdin', io.TextIOWrapper(io.BytesIO(source.encode())),
+    )
+    cmd.main(['-', '--stdin-filename', 'addOne.s'])
+    out = capsys.readouterr().out
+    assert out.splitlines() == [
+        'E:: Tab found. Only spaces allowed.',
+        '9: \tMOV r0, r0',
+        '   ^',
+    ]
+
+
+def test_multi_max_findings(tmp_path, capsys):
+    files = [
+        write(tmp_path, f'bad{i}.s', GOOD_SOURCE.replace('    MOV', '\tmov'))
+        for i in range(4)
+    ]
+
+    def findings(argv):
+        assert cmd.multi(['--jobs', '2'] + argv + files) == 1
+        out = capsys.readouterr().out
+        return [line for line in out.splitlines() if line.startswith('E:')]
+
+    assert len(findings([])) == 8
+    assert len(findings(['--fail-fast'])) == 1
+    assert len(findings(['--max-findings', '3'])) == 3
+    assert len(findings(['--max-findings-per-file', '1'])) == 4
+
+
+@pytest.mark.parametrize(
+    'option', ['--max-findings', '--max-findings-per-file'],
+)
+@pytest.mark.parametrize('value', ['0', '-1', 'x'])
+def test_multi_max_findings_invalid(option, value, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        cmd.multi([option, value, 'addOne.s'])
+    assert exc_info.value.code == 2
+    assert option in capsys.readouterr().err
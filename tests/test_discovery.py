@@ -0,0 +1,79 @@
+import os
+
+from jhu_assembly_linter import cmd
+from jhu_assembly_linter.discovery import iter_files
+
+
+def make_tree(root):
+    for path in (
+        'hw1/addMain.s',
+        'hw1/notes.txt',
+        'hw2/lib/libMath.s',
+        'hw2/mulMain.s',
+        'build/generated.s',
+    ):
+        path = root / path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('')
+
+
+def relative(root, paths):
+    return [os.path.relpath(path, root) for path in paths]
+
+
+def test_iter_files_directory(tmp_path):
+    make_tree(tmp_path)
+    assert relative(tmp_path, iter_files([str(tmp_path)])) == [
+        'build/generated.s',
+        'hw1/addMain.s',
+        'hw2/lib/libMath.s',
+        'hw2/mulMain.s',
+    ]
+
+
+def test_iter_files_include_exclude(tmp_path):
+    make_tree(tmp_path)
+    files = iter_files(
+        [str(tmp_path)],
+        include=['*Main.s'],
+        exclude=['build'],
+    )
+    assert relative(tmp_path, files) == ['hw1/addMain.s', 'hw2/mulMain.s']
+
+    files = iter_files([str(tmp_path)], exclude=['lib*.s'])
+    assert 'hw2/lib/libMath.s' not in relative(tmp_path, files)
+
+
+def test_iter_files_glob(tmp_path):
+    make_tree(tmp_path)
+    files = iter_files([str(tmp_path / 'hw2' / '**' / '*.s')])
+    assert sorted(relative(tmp_path, files)) == [
+        'hw2/lib/libMath.s',
+        'hw2/mulMain.s',
+    ]
+
+
+def test_iter_files_explicit_file(tmp_path):
+    make_tree(tmp_path)
+    notes = str(tmp_path / 'hw1' / 'notes.txt')
+    assert list(iter_files([notes])) == [notes]
+    assert list(iter_files([notes], exclude=['*.txt'])) == []
+
+
+def test_iter_files_is_lazy(tmp_path):
+    make_tree(tmp_path)
+    files = iter_files([str(tmp_path)])
+    assert os.path.relpath(next(files), tmp_path) == 'build/generated.s'
+
+
+def test_multi_directory(tmp_path, capsys):
+    (tmp_path / 'hw').mkdir()
+    (tmp_path / 'hw' / 'bad.s').write_text('\tMOV r0, r0\n')
+    (tmp_path / 'hw' / 'notes.txt').write_text('\tnot assembly\n')
+
+    assert cmd.multi(['--jobs', '1', str(tmp_path)]) == 1
+    headers = [
+        line for line in capsys.readouterr().out.splitlines()
+        if line.startswith('---')
+    ]
+    assert headers == [f'--- {tmp_path / "hw" / "bad.s"}']
@@ -80,3 +80,33 @@ def test_finding_line_with_no_source():
             line_number=1,
             columns=(0,),
         )
+
+
+def test_finding_tuple_round_trip():
+    finding = Finding(
+        message='Error found.',
+        line_number=14,
+        columns=(4, 9),
+        source='The error is here...',
+        rule='tab',
+    )
+    data = finding.as_tuple()
+    assert data == ('Error found.', 14, (4, 9), 'The error is here...', 'tab')
+    assert str(Finding.from_tuple(data)) == str(finding)
+
+
+def test_finding_is_compact_and_renders_once():
+    source = 'The error is here...'
+    finding = Finding(
+        message='Error found.',
+        line_number=14,
+        columns=(4, 9),
+        source=source,
+    )
+    assert not hasattr(finding, '__dict__')
+    assert finding.source is source
+
+    rendered = str(finding)
+    assert str(finding) is rendered
+    assert repr(finding) == \
+        "Finding('Error found.', line_number=14, columns=(4, 9))"
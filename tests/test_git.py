@@ -0,0 +1,129 @@
+import shutil
+import subprocess
+
+import pytest
+
+from jhu_assembly_linter import cmd
+from jhu_assembly_linter.git import changed_lines, parse_diff
+from tests.helpers import GOOD_SOURCE, write
+
+DIFF = '''\
+diff --git a/addOne.s b/addOne.s
+index 1111111..2222222 100644
+--- a/addOne.s
++++ b/addOne.s
+@@ -3 +3,2 @@ add:
+-    MOV r0, r0
++    MOV r0, r1
++    MOV r1, r1
+@@ -9,0 +11 @@ add:
++    ADD r0, r0, r1
+@@ -12 +13,0 @@ add:
+-    SUB r0, r0, r1
+diff --git a/dir/new.s b/dir/new.s
+new file mode 100644
+--- /dev/null
++++ b/dir/new.s
+@@ -0,0 +1,3 @@
++a
++b
++c
+diff --git a/a b.s b/a b.s
+--- a/a b.s\t
++++ b/a b.s\t
+@@ -1 +1,2 @@
+-++ a
++++ b
++++ c
+'''
+
+
+def test_parse_diff():
+    assert parse_diff(DIFF) == {
+        'addOne.s': [(3, 4), (11, 11)],
+        'dir/new.s': [(1, 3)],
+        'a b.s': [(1, 2)],
+    }
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    if shutil.which('git') is None:
+        pytest.skip('git not available')
+
+    def git(*args):
+        subprocess.run(
+            ('git', '-c', 'user.name=Test', '-c', 'user.email=test@test')
+            + args,
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git('init', '-q')
+    write(tmp_path, 'addOne.s', GOOD_SOURCE.replace('    MOV', '\tMOV'))
+    write(tmp_path, 'addTwo.s', GOOD_SOURCE.replace('    MOV', '\tMOV'))
+    git('add', '.')
+    git('commit', '-q', '-m', 'Initial')
+
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_changed_lines(repo):
+    (repo / 'addOne.s').write_text(
+        (repo / 'addOne.s').read_text() + '\tADD r0, r0, r0\n',
+    )
+
+    assert changed_lines() == {'addOne.s': [(11, 11)]}
+    assert changed_lines(paths=['addTwo.s']) == {}
+
+
+def test_multi_diff(repo, capsys):
+    (repo / 'addOne.s').write_text(
+        (repo / 'addOne.s').read_text() + '\tADD r0, r0, r0\n',
+    )
+
+    assert cmd.multi(['--diff']) == 1
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == '--- addOne.s'
+    # The untouched tab on line 9 and the untouched file are not reported.
+    assert [line for line in out if line.startswith('E:')] == [
+        'E:: Tab found. Only spaces allowed.',
+    ]
+    assert '11: \tADD r0, r0, r0' in out
+
+
+def test_multi_diff_no_changes(repo, capsys):
+    assert cmd.multi(['--diff-base', 'HEAD']) == 0
+    assert capsys.readouterr().out == ''
+
+
+def test_multi_diff_with_files(repo, capsys):
+    for name in ('addOne.s', 'addTwo.s'):
+        (repo / name).write_text(
+            (repo / name).read_text() + '\tADD r0, r0, r0\n',
+        )
+
+    # The file names are not taken as the base commit.
+    assert cmd.multi(['--diff', 'addTwo.s']) == 1
+    out = capsys.readouterr().out.splitlines()
+    assert out[0] == '--- addTwo.s'
+    assert '--- addOne.s' not in out
+
+
+def test_multi_diff_base(repo, capsys):
+    (repo / 'addOne.s').write_text(
+        (repo / 'addOne.s').read_text() + '\tADD r0, r0, r0\n',
+    )
+
+    assert cmd.multi(['--diff-base', 'HEAD', 'addOne.s']) == 1
+    assert capsys.readouterr().out.splitlines()[0] == '--- addOne.s'
+
+
+def test_changed_lines_special_names(repo):
+    for name in ('a b.s', 'café.s'):
+        write(repo, name, GOOD_SOURCE)
+    subprocess.run(('git', 'add', '.'), cwd=repo, check=True)
+
+    assert changed_lines() == {'a b.s': [(1, 10)], 'café.s': [(1, 10)]}
@@ -0,0 +1,64 @@
+from jhu_assembly_linter.instruction import is_register, parse_instruction
+from jhu_assembly_linter.linter import Linter
+
+
+def spans(text, start=0):
+    mnemonic, operands, comment = parse_instruction(text, start)
+    return (
+        text[slice(*mnemonic)] if mnemonic else None,
+        [text[slice(*span)] for span in operands],
+        text[slice(*comment)] if comment else None,
+    )
+
+
+def test_parse_instruction():
+    assert parse_instruction('    MOV x0, x1\n', 4) == \
+        ((4, 7), ((8, 10), (12, 14)), None)
+    assert spans('LDR x0, [sp, #16]!') == ('LDR', ['x0', 'sp', '#16'], None)
+    assert spans('STP x29, x30, [sp, #-16]!') == \
+        ('STP', ['x29', 'x30', 'sp', '#-16'], None)
+    assert spans('SUB x0, x1, #-0x10') == ('SUB', ['x0', 'x1', '#-0x10'], None)
+    assert spans('PUSH {r4-r6, lr}') == ('PUSH', ['r4', 'r6', 'lr'], None)
+    assert spans('B.EQ loop  // X0 is zero\n') == \
+        ('B.EQ', ['loop'], '// X0 is zero')
+    assert spans('ADD x0, /* X1 */ x2 /* W3 */\n') == \
+        ('ADD', ['x0', 'x2'], '/* W3 */')
+    assert spans('MOV r0, r1 @ R2') == ('MOV', ['r0', 'r1'], '@ R2')
+    assert spans('/* only a comment */') == \
+        (None, [], '/* only a comment */')
+
+
+def test_is_register():
+    for token in ('r0', 'R15', 'x29', 'W3', 'sp', 'WSP', 'xzr', 'LR'):
+        assert is_register(token)
+    for token in ('R1x', 'loop', '#4', 'x', 'spare'):
+        assert not is_register(token)
+
+
+def test_check_registers_lowercase_arm64():
+    linter = Linter('')
+    linter._Linter__lines = [
+        'STP X29, x30, [SP, #-16]!\n',
+        'ADD w0, W1, wzr // X2 in a comment\n',
+        'SUB x0, /* X1 */ x2\n',
+        '/* MOV X0 */\n',
+    ]
+    linter._check_registers_lowercase()
+    assert [(f.line_number, f.columns) for f in linter.findings] == [
+        (1, (4, 7)), (1, (15, 17)), (2, (8, 10)),
+    ]
+
+    linter._findings = []
+    linter._check_instructions_uppercase()
+    assert linter.findings == []
+
+
+def test_simple_form_matches_tokenizer():
+    from jhu_assembly_linter.instruction import TOKEN_PATTERN
+
+    for text in (
+        'MOV x0, x1\n', 'RET\n', 'MADD x0, x1, x2, x3  \n',
+        'ADD x0,x1,x2,x3,x4\n', 'CMP x0,  #4\n', 'B.EQ loop\n',
+    ):
+        tokens = [m.span() for m in TOKEN_PATTERN.finditer(text)]
+        assert parse_instruction(text) == (tokens[0], tuple(tokens[1:]), None)
@@ -1,3 +1,4 @@
+from jhu_assembly_linter import rules
 from jhu_assembly_linter.linter import Linter
 
 
@@ -356,6 +357,81 @@ def test_check_end_follows_text_section():
     linter._check_end_follows_text_section()
     assert len(linter.findings) == 0
 
+    # Findings point at the function and END lines.
+    linter = Linter("")
+    linter._Linter__lines = [
+        '.text',
+        'first:',
+        '# END first',
+        '.text',
+        'second:',
+        '# END third',
+    ]
+    linter._check_end_follows_text_section()
+    assert [(f.message, f.line_number) for f in linter.findings] == [
+        ('Function second missing END comment.', 5),
+        ('END comment for third without associated function.', 6),
+    ]
+
+
+def test_label_index():
+    linter = Linter("")
+    linter._Linter__lines = [
+        '# Functions: add',
+        'add:',
+        '.text',
+        '',
+        'main: MOV r0, r0',
+        '.text',
+        'sub:',
+        '# END sub',
+    ]
+    linter._run_rule(rules.FileNameMainRule())
+    index = linter._index
+
+    assert [(label.name, label.record.number) for label in index.labels] == [
+        ('add', 2), ('main', 5), ('sub', 7),
+    ]
+    assert [label.is_function for label in index.labels] == [
+        True, False, True,
+    ]
+    assert index.labels[0].section is None
+    assert index.labels[1].section.number == 3
+    assert index.labels[2].section.number == 6
+    assert [s.first.number for s in index.sections] == [4, 7]
+    assert [(name, r.number) for name, r in index.ends] == [('sub', 8)]
+    assert index.function_names == {'add', 'sub'}
+    assert index.first_label('main').record.number == 5
+
+
+def test_label_index_other_sections():
+    linter = Linter("")
+    linter._Linter__lines = [
+        '.text',
+        'main:',
+        '.data',
+        'msg: .asciz "x"',
+        '.section .text',
+        'f:',
+    ]
+    linter._run_rule(rules.FileNameMainRule())
+    labels = linter._index.labels
+
+    assert labels[0].section.number == 1
+    # A label after .data is not in the earlier .text section.
+    assert labels[1].section is None
+    assert labels[2].section is None
+
+
+def test_end_after_text_reported_once():
+    linter = Linter("")
+    linter._Linter__lines = ['.text\n', '# END f\n', 'f:\n']
+    linter._check_end_follows_text_section()
+
+    assert [f.message for f in linter.findings] == [
+        'Expected function name after .text block start.',
+    ]
+
 
 def test_check_instructions_uppercase():
     linter = Linter("")
@@ -382,6 +458,34 @@ def test_check_registers_lowercase():
     assert linter.findings[0].line_number == 2
     assert linter.findings[1].line_number == 3
     assert linter.findings[2].line_number == 3
+    assert linter.findings[0].columns == (4, 6)
+    assert linter.findings[1].columns == (4, 6)
+    assert linter.findings[2].columns == (8, 10)
+
+    # Adjacent registers sharing a separator.
+    linter = Linter("")
+    linter._Linter__lines = [
+        'ADD R10,R11,R12',
+        'ADD r0, R1x, R2',
+    ]
+    linter._check_registers_lowercase()
+    assert [f.columns for f in linter.findings] == [
+        (4, 7), (8, 11), (12, 15), (13, 15),
+    ]
+
+
+def test_check_registers_lowercase_many_operands():
+    operands = 20000
+    linter = Linter("")
+    linter._Linter__lines = [
+        'PUSH ' + ','.join(f'R{i % 16}' for i in range(operands)),
+        'PUSH ' + ', '.join(f'r{i % 16}' for i in range(operands)),
+    ]
+
+    linter._check_registers_lowercase()
+
+    assert len(linter.findings) == operands
+    assert all(f.line_number == 1 for f in linter.findings)
 
 
 def test_check_line_empty_with_nonzero_space():
@@ -441,3 +545,219 @@ def test_check_is_function_line():
     assert linter._check_is_function_line('main:')
     assert linter._check_is_function_line('_start:')
     assert not linter._check_is_function_line(' func: ')
+
+
+def test_records():
+    linter = Linter("")
+    linter._Linter__lines = [
+        '# Program Name: helloWorld.s',
+        '',
+        '.text',
+        'main:',
+        '    MOV r0, r0',
+        '# END main',
+    ]
+    assert [r.kind for r in linter._records] == [
+        'comment', 'blank', 'directive', 'label', 'instruction', 'end',
+    ]
+    assert [r.number for r in linter._records] == [1, 2, 3, 4, 5, 6]
+    assert linter._records[3].label == 'main'
+    assert linter._records[4].indent == 4
+    assert linter._records[5].end_name == 'main'
+    assert linter._records[5].is_comment
+
+    # Records are rebuilt when the underlying lines change.
+    linter._Linter__lines = ['MOV r0, r0']
+    assert [r.kind for r in linter._records] == ['instruction']
+
+
+def test_line_classification_matches_uncompiled():
+    from benchmarks.run import classify, classify_uncompiled
+
+    lines = [
+        '# Program Name: helloWorld.s',
+        '.text',
+        'main:',
+        '    MOV r0, r0',
+        '    ldr x0, =helloWorld  /* comment */',
+        '',
+        '# END main',
+    ]
+
+    # Timed against each other by the classify benchmarks.
+    assert [bool(classify_uncompiled(line)) for line in lines] == \
+        [bool(classify(line)) for line in lines]
+
+
+def test_lint_streams_file(tmp_path):
+    lines = [
+        '# Program Name: addMain.s\n',
+        '# Author: John Doe\n',
+        '# Date: 11/11/2020\n',
+        '# Purpose: To add numbers.\n',
+        '# Functions: add\n',
+        '\n',
+        '.text\n',
+        'add:\n',
+        '\tmov R0, r0\n',
+        '  \n',
+        '# END add\n',
+    ]
+    path = tmp_path / 'addMain.s'
+    path.write_text(''.join(lines))
+
+    streamed = Linter(str(path))
+    streamed.lint()
+    # Lines are never buffered when linting straight from the file.
+    assert streamed._Linter__lines is Linter.SENTIAL_EMPTY_LINES
+
+    loaded = Linter(str(path))
+    loaded._Linter__lines = lines
+    loaded.lint()
+
+    assert [str(f) for f in streamed.findings] == \
+        [str(f) for f in loaded.findings]
+    assert [f.message for f in streamed.findings] == [
+        'File name ends with "Main" but no main function found.',
+        'Instruction is not uppercase.',
+        'Register is not lowercase.',
+        'Non-functional whitespace found.',
+        'Tab found. Only spaces allowed.',
+    ]
+
+
+def test_from_source():
+    source = '# Program Name: addMain.s\r\n\tMOV r0, r0\r\n'
+    for value in (source, source.encode(), source.splitlines(True)):
+        linter = Linter.from_source(value, file='addMain.s')
+        linter.lint()
+        assert linter._file == 'addMain.s'
+        assert [f.line_number for f in linter.findings if f.line_number] == [
+            2,
+        ]
+
+    # Newlines are translated as they are when reading a file.
+    linter = Linter.from_source('MOV r0, r0\r\n\r\n')
+    assert linter._lines == ['MOV r0, r0\n', '\n']
+    assert linter._file == 'stdin.s'
+
+
+def test_from_source_text_in_chunks(monkeypatch):
+    source = '# Program Name: addMain.s\n' + '\tMOV R0, r0 \n' * 50
+    expected = Linter.from_source(source.splitlines(True), file='addMain.s')
+    expected.lint()
+
+    monkeypatch.setattr(Linter, 'CHUNK_SIZE', 64)
+    linter = Linter.from_source(source, file='addMain.s')
+    linter.lint()
+
+    assert sorted(f.as_tuple() for f in linter.findings) == \
+        sorted(f.as_tuple() for f in expected.findings)
+    # The text was linted in blocks, without being split into a list.
+    assert linter._Linter__lines is None
+
+
+def test_update():
+    def keys(findings):
+        return [(f.rule, f.message, f.line_number, f.columns) for f in findings]
+
+    source = [
+        '# Program Name: addOne.s\n',
+        '# Author: John Doe\n',
+        '# Date: 11/11/2020\n',
+        '# Purpose: To add one.\n',
+        '# Functions: addOne\n',
+        '.text\n',
+        'addOne:\n',
+        '    ADD r0, r0, #1\n',
+        '\tMOV r1, r0\n',
+        '# END addOne\n',
+    ]
+    linter = Linter.from_source(source, file='addOne.s')
+    linter.lint()
+    assert keys(linter.findings) == [
+        ('tab', 'Tab found. Only spaces allowed.', 9, (0,)),
+    ]
+
+    # Fix the tab.
+    added, removed = linter.update(8, 9, '    MOV r1, r0\n')
+    assert added == []
+    assert keys(removed) == [
+        ('tab', 'Tab found. Only spaces allowed.', 9, (0,)),
+    ]
+    assert linter.findings == []
+
+    # Insert a bad line, only the changed lines are classified again.
+    classified = []
+    classify_line = linter._classify_line
+
+    def counting_classify_line(number, line):
+        classified.append(number)
+        return classify_line(number, line)
+
+    linter._classify_line = counting_classify_line
+    added, removed = linter.update(7, 7, '    mov R2, r0\n  \n')
+    assert classified == [8, 9]
+    assert keys(added) == [
+        ('instruction-case', 'Instruction is not uppercase.', 8, (4,)),
+        ('register-case', 'Register is not lowercase.', 8, (8, 10)),
+        ('blank-whitespace', 'Non-functional whitespace found.', 9, (0, 3)),
+    ]
+    assert removed == []
+
+    # File level rules are recomputed and moved lines renumbered.
+    added, removed = linter.update(0, 1, '\tMOV r0, r0\n')
+    expected = Linter.from_source(linter._lines, file='addOne.s')
+    expected.lint()
+    assert keys(linter.findings) == keys(expected.findings)
+    assert ('register-case', 'Register is not lowercase.', 8, (8, 10)) \
+        in keys(linter.findings)
+    assert keys(removed) == []
+    assert ('tab', 'Tab found. Only spaces allowed.', 1, (0,)) in keys(added)
+
+    # Deleting lines renumbers the lines after them.
+    added, removed = linter.update(0, 2, '')
+    expected = Linter.from_source(linter._lines, file='addOne.s')
+    expected.lint()
+    assert keys(linter.findings) == keys(expected.findings)
+    assert ('register-case', 'Register is not lowercase.', 6, (8, 10)) \
+        in keys(added)
+
+
+def test_max_findings_stops_reading():
+    from jhu_assembly_linter.stats import LintStats
+
+    lines = ['\tMOV r0, r0\n'] * 100
+    stats = LintStats()
+    linter = Linter.from_source(
+        lines, file='addOne.s', stats=stats, max_findings=3,
+    )
+    linter.lint()
+
+    assert len(linter.findings) == 3
+    assert stats.rules['read'].lines < 10
+
+
+def test_lint_many():
+    from benchmarks.corpus import generate_source
+
+    from jhu_assembly_linter.linter import lint_many
+
+    sources = [
+        (f'dir/file{i}.s', generate_source(f'file{i}.s', violations=0.2,
+                                           seed=i))
+        for i in range(5)
+    ]
+    sources.append(('Bad_Main.s', 'main:\n\tmov R0, r0\n'))
+
+    expected = []
+    for file, source in sources:
+        linter = Linter.from_source(source, file=file)
+        linter.lint()
+        expected.append((file, [f.as_tuple() for f in linter.findings]))
+
+    results = lint_many(iter(sources))
+    assert [
+        (file, [f.as_tuple() for f in findings])
+        for file, findings in results
+    ] == expected
@@ -0,0 +1,89 @@
+import io
+import json
+
+from jhu_assembly_linter import cmd
+from jhu_assembly_linter.output import get_writer
+
+FINDINGS = {
+    'first.s': [
+        ('Tab found. Only spaces allowed.', 2, (0,), '\tMOV r0, r0\n', 'tab'),
+        ('Register is not lowercase.', 3, (4, 6), 'MOV R0, r0\n',
+         'register-case'),
+    ],
+    'second.s': [
+        ('File starts with non-lowercase letter.', 0, (), '', 'file-name'),
+    ],
+}
+
+
+def render(name, headers=True):
+    stream = io.StringIO()
+    writer = get_writer(name, stream, headers=headers)
+    for filename, findings in FINDINGS.items():
+        writer.write(filename, findings)
+    writer.write('empty.s', [])
+    writer.close()
+    return stream.getvalue()
+
+
+def test_text():
+    assert render('text') == '\n'.join((
+        '--- first.s',
+        'E:: Tab found. Only spaces allowed.',
+        '2: \tMOV r0, r0',
+        '   ^',
+        'E:: Register is not lowercase.',
+        '3: MOV R0, r0',
+        '       ^^',
+        '--- second.s',
+        'E:: File starts with non-lowercase letter.',
+        '',
+    ))
+    assert not render('text', headers=False).startswith('---')
+
+
+def test_jsonl():
+    records = [json.loads(line) for line in render('jsonl').splitlines()]
+    assert len(records) == 3
+    assert records[1] == {
+        'file': 'first.s',
+        'rule': 'register-case',
+        'line': 3,
+        'columns': [4, 6],
+        'message': 'Register is not lowercase.',
+        'source': 'MOV R0, r0',
+    }
+
+
+def test_json():
+    records = json.loads(render('json'))
+    assert [r['file'] for r in records] == ['first.s', 'first.s', 'second.s']
+
+    stream = io.StringIO()
+    get_writer('json', stream).close()
+    assert json.loads(stream.getvalue()) == []
+
+
+def test_sarif():
+    log = json.loads(render('sarif'))
+    assert log['version'] == '2.1.0'
+    run, = log['runs']
+    assert run['tool']['driver']['name'] == 'jhu-assembly-linter'
+
+    results = run['results']
+    assert len(results) == 3
+    assert results[1]['ruleId'] == 'register-case'
+    assert results[1]['locations'][0]['physicalLocation'] == {
+        'artifactLocation': {'uri': 'first.s'},
+        'region': {'startLine': 3, 'startColumn': 5, 'endColumn': 7},
+    }
+    assert 'region' not in results[2]['locations'][0]['physicalLocation']
+
+
+def test_multi_format(tmp_path, capsys):
+    path = tmp_path / 'bad.s'
+    path.write_text('\tMOV r0, r0\n')
+
+    assert cmd.multi(['--jobs', '1', '--format', 'json', str(path)]) == 1
+    records = json.loads(capsys.readouterr().out)
+    assert {r['file'] for r in records} == {str(path)}
@@ -0,0 +1,95 @@
+import io
+
+import pytest
+
+from jhu_assembly_linter import cmd, rules
+from jhu_assembly_linter.linter import Linter
+
+
+def test_rule_ids_are_unique():
+    assert len(rules.REGISTRY) == len(rules.RULES)
+    assert all(rule.id for rule in rules.RULES)
+
+
+def test_select_rules():
+    assert rules.select_rules() == rules.RULES
+    assert rules.select_rules(['tab', 'preamble']) == (
+        rules.PreambleRule, rules.TabRule,
+    )
+    assert rules.TabRule not in rules.select_rules(ignore=['tab'])
+
+    with pytest.raises(ValueError):
+        rules.select_rules(['not-a-rule'])
+
+
+def test_findings_carry_rule_id():
+    linter = Linter.from_source('\tmov r0, r0\n', file='add.s')
+    linter.lint()
+    assert {f.rule for f in linter.findings} == {
+        'preamble', 'instruction-case', 'tab',
+    }
+
+
+def test_unselected_rules_do_no_work(monkeypatch):
+    # File level rules alone never read the file.
+    linter = Linter('does/not/exist.s', rules=[rules.FileNameRule])
+    linter.lint()
+    assert linter.findings == []
+
+    # Raw text rules alone never classify lines.
+    def fail(*args):
+        raise AssertionError('Line classified.')
+
+    linter = Linter.from_source('\tMOV r0, r0\n', rules=[rules.TabRule])
+    monkeypatch.setattr(linter, '_classify_line', fail)
+    linter.lint()
+    assert [f.rule for f in linter.findings] == ['tab']
+
+
+def test_multi_select_ignore(tmp_path, capsys):
+    path = tmp_path / 'bad.s'
+    path.write_text('\tmov r0, r0\n')
+
+    assert cmd.multi(['--jobs', '1', '--select', 'tab', str(path)]) == 1
+    out = capsys.readouterr().out
+    assert out.count('E::') == 1
+    assert 'Tab found' in out
+
+    argv = ['--jobs', '1', '--ignore', 'tab,preamble,instruction-case']
+    assert cmd.multi(argv + [str(path)]) == 0
+
+    with pytest.raises(SystemExit):
+        cmd.multi(['--select', 'nope', str(path)])
+
+
+def test_index_rules_read_lines(tmp_path):
+    path = tmp_path / 'add.s'
+    path.write_text('.text\nmain:\n')
+
+    linter = Linter(str(path), rules=[rules.FileNameMainRule])
+    linter.lint()
+    assert [f.line_number for f in linter.findings] == [2]
+
+
+@pytest.mark.parametrize('chunk_size', [1 << 20, 7])
+def test_scanning_matches_feeding(tmp_path, monkeypatch, chunk_size):
+    from benchmarks.corpus import generate_source
+
+    source = generate_source('addOne.s', lines=300, violations=0.3) + \
+        '\t\tMOV r0, r0 \t\n \x0c\né\tx\n   '
+    path = tmp_path / 'addOne.s'
+    path.write_text(source)
+    monkeypatch.setattr(Linter, 'CHUNK_SIZE', chunk_size)
+
+    def keys(linter):
+        linter.lint()
+        return [f.as_tuple() for f in linter.findings]
+
+    lines = io.StringIO(source, newline=None).readlines()
+    fed = keys(Linter.from_source(lines, file='addOne.s'))
+    assert any(f[4] == 'tab' for f in fed)
+    assert any(f[4] == 'blank-whitespace' for f in fed)
+    assert keys(Linter.from_source(source, file='addOne.s')) == fed
+    assert keys(Linter(str(path))) == fed
+    assert keys(Linter(str(path), rules=[rules.TabRule])) == \
+        [f for f in fed if f[4] == 'tab']
@@ -0,0 +1,145 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from jhu_assembly_linter import client
+from jhu_assembly_linter.linter import Linter
+from jhu_assembly_linter.server import LintServer, handle_request
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, 'AF_UNIX'), reason='Unix sockets not available',
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # Keep the path short; Unix socket paths are limited to ~100 bytes.
+    path = f'/tmp/jal-test-{id(tmp_path)}.sock'
+    server = LintServer(path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_lint_path(socket_path, tmp_path):
+    path = tmp_path / 'addOne.s'
+    path.write_text('\tMOV R0, r0\n')
+
+    expected = Linter(str(path))
+    expected.lint()
+
+    with client.Client(socket_path) as c:
+        findings = c.lint_path(str(path))
+        # The connection can be reused.
+        assert c.lint_path(str(path)) == findings
+
+    assert findings == [f.as_tuple() for f in expected.findings]
+
+
+def test_client_lint_source(socket_path):
+    with client.Client(socket_path) as c:
+        findings = c.lint_source('\tMOV r0, r0\n', file='addMain.s')
+        assert (
+            'Tab found. Only spaces allowed.', 1, (0,), '\tMOV r0, r0\n', 'tab',
+        ) in findings
+
+        with pytest.raises(RuntimeError):
+            c.lint_path('/does/not/exist.s')
+
+
+def test_client_main(socket_path, tmp_path, capsys):
+    good = tmp_path / 'good.s'
+    good.write_text('')
+    bad = tmp_path / 'bad.s'
+    bad.write_text('\tMOV r0, r0\n')
+
+    assert client.main(['--socket', socket_path, str(bad)]) == 1
+    assert capsys.readouterr().out.startswith(f'--- {bad}\n')
+
+    assert client.main(['--socket', '/tmp/jal-missing.sock', str(good)]) == 2
+
+
+def test_client_main_errors(socket_path, tmp_path, capsys):
+    missing = tmp_path / 'missing.s'
+    bad = tmp_path / 'bad.s'
+    bad.write_text('\tMOV r0, r0\n')
+
+    # An error on one file is reported and the others are still linted.
+    assert client.main(['--socket', socket_path, str(missing), str(bad)]) \
+        == 2
+    captured = capsys.readouterr()
+    assert captured.err.startswith(f'{missing}: FileNotFoundError')
+    assert captured.out.startswith(f'--- {bad}\n')
+
+
+@pytest.mark.parametrize('request_', [
+    [], 'addOne.s', {'path': 5}, {'source': 5}, {'file': ''},
+    {'source': '', 'file': ''},
+])
+def test_handle_request_invalid(request_):
+    assert 'error' in handle_request(request_)
+
+
+def test_client_invalid_request(socket_path):
+    with client.Client(socket_path) as c:
+        c._socket.sendall(b'[]\n{"source": 5}\n')
+        # The server answers both and keeps serving the connection.
+        assert 'error' in json.loads(c._reader.readline())
+        assert 'error' in json.loads(c._reader.readline())
+        assert c.lint_source('\tMOV r0, r0\n')
+
+
+def test_client_server_closed(tmp_path):
+    path = f'/tmp/jal-test-{id(tmp_path)}.sock'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+        listener.listen()
+        try:
+            with client.Client(path) as c:
+                listener.accept()[0].close()
+                with pytest.raises(ConnectionError):
+                    c.lint_source('')
+        finally:
+            os.remove(path)
+
+
+def test_server_socket_in_use(socket_path, tmp_path):
+    with pytest.raises(FileExistsError):
+        LintServer(socket_path)
+
+    path = tmp_path / 'file'
+    path.write_text('')
+    with pytest.raises(FileExistsError):
+        LintServer(str(path))
+    assert path.exists()
+
+
+def test_server_stale_socket(tmp_path):
+    path = f'/tmp/jal-test-{id(tmp_path)}.sock'
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+        dead.bind(path)
+
+    LintServer(path).server_close()
+    assert not os.path.exists(path)
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert os.path.dirname(client.default_socket_path()) == str(tmp_path)
+
+    monkeypatch.delenv('XDG_RUNTIME_DIR')
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    path = client.default_socket_path(create=True)
+    directory = os.path.dirname(path)
+    assert os.path.dirname(directory) == str(tmp_path)
+    assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    os.chmod(directory, 0o755)
+    with pytest.raises(PermissionError):
+        client.default_socket_path()
@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+
+from tests.helpers import write
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+
+# Cumulative import time of running `cmd.main` on one file, in
+# microseconds. Generous so slow machines pass; raise it only knowingly.
+IMPORT_BUDGET = 75_000
+
+# Modules a plain single-file run has no use for.
+DEFERRED = (
+    'asyncio',
+    'concurrent.futures',
+    'glob',
+    'hashlib',
+    'json',
+    'socket',
+    'subprocess',
+    'tarfile',
+    'tempfile',
+    'zipfile',
+    'jhu_assembly_linter.archive',
+    'jhu_assembly_linter.cache',
+    'jhu_assembly_linter.discovery',
+    'jhu_assembly_linter.git',
+    'jhu_assembly_linter.stats',
+)
+
+SCRIPT = '''\
+import sys
+from jhu_assembly_linter import cmd
+cmd.main([sys.argv[1]])
+print(' '.join(sorted(sys.modules)), file=sys.stderr)
+'''
+
+
+def run_main(path, pycache):
+    env = dict(
+        os.environ,
+        PYTHONPATH=SRC,
+        PYTHONPYCACHEPREFIX=pycache,
+        PYTHONDONTWRITEBYTECODE='',
+    )
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SCRIPT, path],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    *timings, modules = result.stderr.splitlines()
+    return timings, set(modules.split())
+
+
+def import_time(timings) -> int:
+    """
+    Sum the top level imports made after interpreter start-up.
+    """
+    total = 0
+    started = False
+    for line in timings:
+        _, cumulative, name = line.split('|')
+        if name.strip() == 'site' and not name.startswith('  '):
+            started = True
+        elif started and not name.startswith('  '):
+            total += int(cumulative)
+    return total
+
+
+def test_main_startup(tmp_path):
+    path = write(tmp_path, 'addOne.s')
+    pycache = str(tmp_path / 'pycache')
+
+    # The first run compiles bytecode, which is not what is measured.
+    run_main(path, pycache)
+    timings, modules = run_main(path, pycache)
+
+    assert modules.isdisjoint(DEFERRED), modules & set(DEFERRED)
+    assert import_time(timings) < IMPORT_BUDGET
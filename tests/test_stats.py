@@ -0,0 +1,39 @@
+from jhu_assembly_linter import cmd
+from jhu_assembly_linter.linter import Linter
+from jhu_assembly_linter.stats import LintStats
+from tests.helpers import GOOD_SOURCE, write
+
+
+def test_lint_records_rule_stats():
+    stats = LintStats()
+    source = GOOD_SOURCE.format(name='add.s').replace('    MOV', '\tMOV')
+    linter = Linter.from_source(source, file='add.s', stats=stats)
+    linter.lint()
+
+    assert stats.files == 1
+    assert stats.rules['tab'].lines == len(source.splitlines())
+    assert stats.rules['tab'].findings == 1
+    assert stats.rules['instruction-case'].lines == 1
+    assert stats.rules['instruction-case'].findings == 0
+
+
+def test_stats_merge_round_trip():
+    stats = LintStats()
+    stats.files = 1
+    stats.rule('tab').lines = 10
+
+    merged = LintStats.from_dict(stats.as_dict())
+    merged.merge(stats)
+
+    assert merged.files == 2
+    assert merged.rules['tab'].lines == 20
+
+
+def test_multi_stats(tmp_path, capsys):
+    files = [write(tmp_path, f'add{i}.s') for i in range(3)]
+
+    assert cmd.multi(['--stats', '--jobs', '2'] + files) == 0
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err.startswith('Linted 3 file(s), 0 from cache')
+    assert 'register-case' in captured.err
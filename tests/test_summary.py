@@ -0,0 +1,74 @@
+import pytest
+
+from jhu_assembly_linter import cmd, rules
+from jhu_assembly_linter.summary import Summary, count_findings
+from tests.helpers import GOOD_SOURCE, write
+
+BAD_SOURCE = GOOD_SOURCE.replace('    MOV r0, r0', '\tmov R0, r0')
+
+
+def test_count_findings():
+    findings = [
+        ('Tab found.', 1, (0,), '\tMOV\n', 'tab'),
+        ('Tab found.', 2, (0,), '\tMOV\n', 'tab'),
+        ('Register is not lowercase.', 2, (5, 7), '\tMOV R0\n',
+         'register-case'),
+    ]
+    assert count_findings(findings) == {'tab': 2, 'register-case': 1}
+
+
+def test_summary_table():
+    summary = Summary()
+    summary.add('a.s', {'tab': 3, 'register-case': 1})
+    summary.add('b.s', {})
+    summary.add('c.s', {'tab': 1})
+
+    assert summary.total == 5
+    assert summary.format_table(top=1).splitlines()[2:] == [
+        'tab                           4',
+        'register-case                 1',
+        '5 finding(s) in 2 of 3 file(s)',
+        '',
+        'Top 1 file(s):',
+        '         4 a.s',
+    ]
+
+
+def test_multi_summary_builds_no_findings(tmp_path, capsys, monkeypatch):
+    files = [write(tmp_path, f'add{i}.s', BAD_SOURCE) for i in range(3)]
+    files.append(write(tmp_path, 'addGood.s'))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('Finding built')
+
+    monkeypatch.setattr(rules, 'Finding', fail)
+    assert cmd.multi(['--jobs', '1', '--summary', '--top', '2'] + files) == 1
+
+    out = capsys.readouterr().out.splitlines()
+    assert 'tab                           3' in out
+    assert '9 finding(s) in 3 of 4 file(s)' in out
+    assert out[-2:] == [f'         3 {files[0]}', f'         3 {files[1]}']
+
+
+def test_multi_summary_cached(tmp_path, capsys):
+    files = [write(tmp_path, f'add{i}.s', BAD_SOURCE) for i in range(2)]
+    argv = ['--summary', '--cache-dir', str(tmp_path / 'cache')] + files
+
+    assert cmd.multi(argv) == 1
+    first = capsys.readouterr().out
+    assert cmd.multi(argv) == 1
+    assert capsys.readouterr().out == first
+    assert '6 finding(s) in 2 of 2 file(s)' in first
+
+
+@pytest.mark.parametrize('argv, error', [
+    (['--summary', '--format', 'json'], '--summary only prints a text table'),
+    (['--top', '3'], '--top requires --summary'),
+    (['--summary', '--top', '-1'], 'argument --top: must be at least 1'),
+    (['--summary', '--top', '0'], 'argument --top: must be at least 1'),
+])
+def test_multi_summary_invalid(argv, error, capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        cmd.multi(argv + ['addOne.s'])
+    assert exc_info.value.code == 2
+    assert error in capsys.readouterr().err